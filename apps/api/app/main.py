@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from law_shared.legal_tools.share.api import ShareSettings, create_app as create_share_app
 from law_shared.legal_tools.workspace.api import (
@@ -28,6 +29,9 @@ def create_app(
         return {"status": "ok"}
 
     share_app.mount("/workspace", workspace_app)
+    # Share/audit listings and workspace payloads carry long Korean text that
+    # compresses well; small responses are passed through untouched.
+    share_app.add_middleware(GZipMiddleware, minimum_size=1024)
     return share_app
 
 
@@ -23,6 +23,13 @@ def clear_offline_env() -> None:
     os.environ.pop("LAW_OFFLINE", None)
 
 
+@pytest.fixture(autouse=True)
+def isolated_stats_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "stats-cache"
+    monkeypatch.setenv("LAW_STATS_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 def test_parser_registers_known_commands() -> None:
     parser = build_parser()
     subparsers_action = parser._subparsers._group_actions[0]  # type: ignore[attr-defined]
@@ -57,6 +64,69 @@ def test_stats_uses_runtime_data_dir(
     assert "기관" in captured.out
 
 
+@pytest.mark.parametrize("no_cache", [False, True])
+def test_stats_process_pool_matches_serial_counts(
+    no_cache: bool,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    data_dir = tmp_path / "dataset"
+    data_dir.mkdir()
+    for idx, inst in enumerate(["갑", "을", "갑"]):
+        sample = {"info": {"title": "t" * (idx + 1), "response_institute": inst}}
+        (data_dir / f"doc{idx}.json").write_text(json.dumps(sample), encoding="utf-8")
+    (data_dir / "broken.json").write_text("{", encoding="utf-8")
+    runtime = config.RuntimeConfig(data_dir=data_dir, log_level="INFO")
+
+    monkeypatch.setattr(stats, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(stats, "_REDUCE_CHUNK", 2)
+    stats.run(Namespace(no_cache=no_cache), runtime)
+    out = capsys.readouterr().out
+
+    assert "Records: 3" in out
+    assert "- 갑: 2" in out
+    assert "Max title length: 3" in out
+
+
+def test_stats_cache_reparses_only_changed_files(
+    tmp_path: Path,
+    isolated_stats_cache: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    data_dir = tmp_path / "dataset"
+    data_dir.mkdir()
+    for name in ("a", "b"):
+        sample = {"info": {"title": name, "response_institute": "갑"}}
+        (data_dir / f"{name}.json").write_text(json.dumps(sample), encoding="utf-8")
+    runtime = config.RuntimeConfig(data_dir=data_dir, log_level="INFO")
+    stats.run(Namespace(), runtime)
+    capsys.readouterr()
+
+    changed = data_dir / "b.json"
+    changed.write_text(
+        json.dumps({"info": {"title": "bbbb", "response_institute": "을"}}),
+        encoding="utf-8",
+    )
+    parsed: list[str] = []
+    original = stats.load_stats_fields
+
+    def tracking(path: Path):
+        parsed.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(stats, "load_stats_fields", tracking)
+    stats.run(Namespace(), runtime)
+    out = capsys.readouterr().out
+
+    assert parsed == ["b.json"]
+    assert "- 을: 1" in out
+    assert "Max title length: 4" in out
+    assert len(list(isolated_stats_cache.glob("stats-*.sqlite"))) == 1
+    assert sorted(p.name for p in data_dir.iterdir()) == ["a.json", "b.json"]
+
+
 def test_ask_command_enables_offline_and_prints_answer(
     monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -84,3 +154,30 @@ def test_ask_command_enables_offline_and_prints_answer(
     captured = capsys.readouterr()
     assert "응답" in captured.out
     assert os.environ.get("LAW_OFFLINE") == "1"
+
+
+def test_uvicorn_server_options_fall_back_to_auto(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from law_shared.legal_cli import services
+
+    monkeypatch.setattr(services.importlib.util, "find_spec", lambda name: None)
+    assert services.uvicorn_server_options() == {"loop": "auto", "http": "auto"}
+
+    monkeypatch.setattr(services.importlib.util, "find_spec", lambda name: object())
+    assert services.uvicorn_server_options() == {
+        "loop": "uvloop",
+        "http": "httptools",
+    }
+
+
+def test_cli_import_does_not_load_chat_stack() -> None:
+    import subprocess
+
+    code = (
+        "import sys, law_shared.legal_cli.runner, law_shared.legal_tools as lt;"
+        "assert 'law_shared.legal_tools.multi_turn_chat' not in sys.modules;"
+        "assert 'ContextualChunker' in lt.__all__"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
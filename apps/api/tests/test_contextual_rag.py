@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import List, Sequence
+
+from law_shared.legal_schemas import Document, Section, SourceType
+from law_shared.legal_tools.contextual_rag import (
+    ContextConfig,
+    ContextualChunker,
+    _embed_length_bucketed,
+    _pack_spans,
+)
+
+
+class RecordingEmbedder:
+    model_name = "fake-embedder"
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+def _statute_sections(count: int) -> List[Section]:
+    # Longest section first so length sorting has to reorder the inputs.
+    return [
+        Section(
+            section_id=f"s{i}",
+            doc_id="law-1",
+            headings_path=["민법", f"제{i}조"],
+            title=f"제{i}조",
+            text=f"제{i}조(목적) " + "이 법은 권리와 의무를 정한다. " * (count - i + 1),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def test_build_index_records_embeds_in_length_sorted_batches() -> None:
+    document = Document(doc_id="law-1", title="민법", source_type=SourceType.statute)
+    embedder = RecordingEmbedder()
+    chunker = ContextualChunker(ContextConfig(embed_batch_size=2))
+
+    records = chunker.build_index_records(document, _statute_sections(5), embedder)
+
+    assert len(records) == 5
+    assert len(embedder.calls) == 3
+    assert all(len(batch) <= 2 for batch in embedder.calls)
+    sent_lengths = [len(text) for batch in embedder.calls for text in batch]
+    assert sent_lengths == sorted(sent_lengths)
+    # Each vector is scattered back to its own chunk, so record order (longest
+    # section first) is preserved.
+    record_lengths = [record.embedding[0] for record in records]
+    assert record_lengths == sorted(record_lengths, reverse=True)
+    assert records[0].embedding_model == "fake-embedder"
+
+
+def test_duplicate_texts_are_embedded_once() -> None:
+    inner = RecordingEmbedder()
+    vectors = _embed_length_bucketed(inner, ["가", "나나", "가", "나나", "다다다"], 2)
+
+    assert [text for batch in inner.calls for text in batch] == ["가", "나나", "다다다"]
+    assert vectors == [[1.0], [2.0], [1.0], [2.0], [3.0]]
+
+
+def test_pack_spans_fills_chunks_up_to_the_token_budget() -> None:
+    span = "가" * 100  # ~50 tokens each
+
+    assert _pack_spans([span] * 5, (10, 120), 0) == [
+        f"{span}\n\n{span}",
+        f"{span}\n\n{span}",
+        span,
+    ]
+    assert _pack_spans([span * 5], (10, 120), 0) == [span * 5]
+    assert _pack_spans([], (10, 120), 0) == []
+    with_overlap = _pack_spans([span] * 3, (10, 120), 5)
+    assert with_overlap[1].startswith("가" * 10 + "\n\n")
@@ -120,3 +120,53 @@ def test_validate_bulk_response_raises_on_failed_item() -> None:
         assert "DOC-1" in str(exc)
     else:
         raise AssertionError("Expected bulk response validation to fail")
+
+
+def test_upload_documents_sends_every_batch_concurrently(monkeypatch) -> None:
+    sent: list[str] = []
+
+    def fake_request_ndjson(method, path, payload):  # type: ignore[no-untyped-def]
+        sent.append(payload)
+        return {"errors": False, "items": []}
+
+    monkeypatch.setattr(opensearch_load, "request_ndjson", fake_request_ndjson)
+
+    documents = [{"id": f"DOC-{i}"} for i in range(7)]
+    upload_documents("legal-docs", documents, batch_size=2, show_progress=False, concurrency=3)
+
+    assert len(sent) == 4
+    ids = sorted(
+        json.loads(line)["index"]["_id"]
+        for payload in sent
+        for line in payload.splitlines()
+        if line.startswith('{"index"')
+    )
+    assert ids == sorted(doc["id"] for doc in documents)
+
+
+def test_upload_documents_stops_submitting_after_first_failure(monkeypatch) -> None:
+    sent: list[str] = []
+
+    def fake_request_ndjson(method, path, payload):  # type: ignore[no-untyped-def]
+        sent.append(payload)
+        raise RuntimeError("bulk rejected")
+
+    monkeypatch.setattr(opensearch_load, "request_ndjson", fake_request_ndjson)
+
+    documents = [{"id": f"DOC-{i}"} for i in range(20)]
+    try:
+        upload_documents(
+            "legal-docs",
+            documents,
+            batch_size=1,
+            max_retries=1,
+            show_progress=False,
+            concurrency=2,
+        )
+    except RuntimeError as exc:
+        assert "bulk rejected" in str(exc)
+    else:
+        raise AssertionError("Expected the bulk failure to propagate")
+
+    # Only the first in-flight window was ever submitted.
+    assert len(sent) <= 2
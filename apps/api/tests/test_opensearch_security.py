@@ -23,3 +23,63 @@ def test_opensearch_url_redacts_inline_credentials():
 
     assert redacted == "https://example.com:9200/index"
     assert "secret" not in redacted
+
+
+def test_search_results_are_cached_per_query(monkeypatch):
+    calls = []
+
+    def fake_request_json(method, path, payload):
+        calls.append(payload["query"]["multi_match"]["query"])
+        return {"hits": {"hits": [{"_id": "1", "_score": 1.5, "_source": {"title": "t"}}]}}
+
+    monkeypatch.setattr(opensearch_search, "request_json", fake_request_json)
+    opensearch_search.clear_search_cache()
+
+    first = opensearch_search.search_opensearch("근로시간", limit=5)
+    second = opensearch_search.search_opensearch("근로시간 ", limit=5)
+    opensearch_search.search_opensearch("근로시간", limit=6)
+
+    assert [doc.id for doc in first] == [doc.id for doc in second] == ["1"]
+    assert calls == ["근로시간", "근로시간"]
+
+    opensearch_search.clear_search_cache()
+    opensearch_search.search_opensearch("근로시간", limit=5)
+    assert len(calls) == 3
+
+
+def test_whitespace_variants_share_a_cache_entry(monkeypatch):
+    calls = []
+
+    def fake_request_json(method, path, payload):
+        calls.append(payload["query"]["multi_match"]["query"])
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(opensearch_search, "request_json", fake_request_json)
+    opensearch_search.clear_search_cache()
+
+    opensearch_search.search_opensearch("민법  제750조　불법행위", limit=5)
+    opensearch_search.search_opensearch("민법 제750조 불법행위", limit=5)
+
+    assert calls == ["민법 제750조 불법행위"]
+
+
+def test_cached_results_expire_after_ttl(monkeypatch):
+    calls = []
+    now = [1000.0]
+
+    def fake_request_json(method, path, payload):
+        calls.append(path)
+        return {"hits": {"hits": []}}
+
+    monkeypatch.setattr(opensearch_search, "request_json", fake_request_json)
+    monkeypatch.setattr(opensearch_search.time, "monotonic", lambda: now[0])
+    monkeypatch.setenv(opensearch_search.SEARCH_CACHE_TTL_ENV, "60")
+    opensearch_search.clear_search_cache()
+
+    opensearch_search.search_opensearch("근로시간", limit=5)
+    now[0] += 59
+    opensearch_search.search_opensearch("근로시간", limit=5)
+    now[0] += 2
+    opensearch_search.search_opensearch("근로시간", limit=5)
+
+    assert len(calls) == 2
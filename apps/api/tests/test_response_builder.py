@@ -163,6 +163,21 @@ def test_build_legal_answer_payload_ignores_markdown_headings_without_citations(
     ]
 
 
+def test_build_legal_answer_payload_splits_short_answers_into_sentences() -> None:
+    # Every line is shorter than the claim-line minimum, so claims come from
+    # the sentence-split fallback.
+    payload = build_legal_answer_payload(
+        question="짧은 답",
+        answer="가[1]. 나",
+        citations=[],
+        evidence=[],
+        queries=[],
+        actions=[],
+    )
+
+    assert [claim["text"] for claim in payload["claims"]] == ["가[1].", "나"]
+
+
 def test_build_legal_answer_payload_returns_system_error_on_search_failure_without_evidence() -> (
     None
 ):
@@ -310,6 +325,25 @@ def test_keyword_search_falls_back_to_local_meili_guidance(
     assert all(hit.doc_id != "MEILI-2024-002" for hit in hits)
 
 
+def test_local_keyword_corpus_is_reused_until_files_change(tmp_path) -> None:
+    meili_dir = tmp_path / "meilisearch"
+    meili_dir.mkdir(parents=True)
+    doc_path = meili_dir / "guidance.json"
+
+    def write(title: str) -> None:
+        payload = {"info": {"doc_id": "LOCAL-1", "title": title}, "taskinfo": {}}
+        doc_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+
+    write("근로시간면제 질의")
+    first = agent_graph._load_local_corpus(meili_dir)
+    assert agent_graph._load_local_corpus(meili_dir) is first
+
+    write("근로시간면제 한도 재설정 질의")
+    refreshed = agent_graph._load_local_corpus(meili_dir)
+    assert refreshed is not first
+    assert refreshed[0].title == "근로시간면제 한도 재설정 질의"
+
+
 def test_evidence_store_reranks_and_filters_irrelevant_hits() -> None:
     store = EvidenceStore(
         top_k=5, context_chars=200, focus_query="근로시간 면제 관련 판례"
@@ -7,6 +7,7 @@ import re
 from fastapi.testclient import TestClient
 
 from law_shared.legal_tools.share import ShareSettings, create_app
+from law_shared.legal_tools.share.redaction import RedactionEngine, RedactionRule
 
 
 def _create_client() -> TestClient:
@@ -187,6 +188,15 @@ def test_share_management_requires_authentication() -> None:
 
     assert created.status_code == 401
 
+    non_ascii = client.get(
+        "/v1/audit",
+        headers={
+            "Authorization": "Bearer 키-é".encode("utf-8"),
+            "X-Actor-ID": "attacker",
+        },
+    )
+    assert non_ascii.status_code == 401
+
 
 def test_share_management_rejects_actor_without_resource_permission() -> None:
     client = _create_client()
@@ -216,3 +226,19 @@ def test_share_management_rejects_actor_without_resource_permission() -> None:
     )
 
     assert created.status_code == 403
+
+
+def test_redaction_preview_passes_clean_fields_through_unchanged() -> None:
+    engine = RedactionEngine()
+
+    preview = engine.preview({"clean": "판례 요약입니다.", "dirty": "메일 a@b.co"})
+
+    assert preview.redacted == {"clean": "판례 요약입니다.", "dirty": "메일 ***@***"}
+    assert [match.field for match in preview.matches] == ["dirty"]
+
+    engine.rules.append(
+        RedactionRule(id="case", pattern=re.compile(r"판례"), replacement="**")
+    )
+    assert engine.preview({"clean": "판례 요약입니다."}).redacted == {
+        "clean": "** 요약입니다."
+    }
@@ -477,3 +477,130 @@ def test_normalize_tool_call_chunk_infers_missing_index() -> None:
     call = normalized[0]
     assert call["index"] == 0
     assert call["type"] == "function"
+
+
+class _HistoryHandler:
+    _ndjson_send = ChatHandler._ndjson_send
+
+    def __init__(self, wfile: Optional[io.BytesIO] = None) -> None:
+        self.wfile = wfile or io.BytesIO()
+        self.responses: List[int] = []
+        self.headers: List[tuple] = []
+
+    def send_response(self, code: int) -> None:
+        self.responses.append(code)
+
+    def send_header(self, key: str, value: str) -> None:
+        self.headers.append((key, value))
+
+    def end_headers(self) -> None:
+        pass
+
+
+def test_thread_history_streams_ndjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    from law_shared.legal_tools import api_server
+
+    class FakeManager:
+        def iter_history(self, thread_id: str) -> Iterator[Dict[str, Any]]:
+            yield {"checkpoint_id": "cp-2", "messages": [{"content": "둘"}]}
+            yield {"checkpoint_id": "cp-1", "messages": [{"content": "하나"}]}
+
+    monkeypatch.setattr(api_server, "_get_chat_manager", lambda: FakeManager())
+    actor = "user-123"
+    thread_id = f"{_thread_prefix_for_actor(actor)}-abc"
+    handler = _HistoryHandler()
+
+    ChatHandler._stream_thread_history(handler, thread_id, actor_id=actor)  # type: ignore[arg-type]
+
+    assert handler.responses == [200]
+    assert ("Content-Type", "application/x-ndjson; charset=utf-8") in handler.headers
+    lines = handler.wfile.getvalue().decode("utf-8").splitlines()
+    assert [json.loads(line)["checkpoint_id"] for line in lines] == ["cp-2", "cp-1"]
+
+
+def test_thread_history_stream_reports_read_failures(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    from law_shared.legal_tools import api_server
+
+    class FailingManager:
+        def iter_history(self, thread_id: str) -> Iterator[Dict[str, Any]]:
+            yield {"checkpoint_id": "cp-2", "messages": []}
+            raise RuntimeError("checkpointer unavailable")
+
+    monkeypatch.setattr(api_server, "_get_chat_manager", lambda: FailingManager())
+    actor = "user-123"
+    handler = _HistoryHandler()
+
+    with caplog.at_level("ERROR", logger=api_server.logger.name):
+        ChatHandler._stream_thread_history(  # type: ignore[arg-type]
+            handler, f"{_thread_prefix_for_actor(actor)}-abc", actor_id=actor
+        )
+
+    lines = [json.loads(line) for line in handler.wfile.getvalue().splitlines()]
+    assert lines[0]["checkpoint_id"] == "cp-2"
+    assert "error" in lines[-1]
+    assert "thread_history_stream_failed" in caplog.text
+
+
+def test_thread_history_stream_stops_when_client_disconnects(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from law_shared.legal_tools import api_server
+
+    read: List[str] = []
+
+    class FakeManager:
+        def iter_history(self, thread_id: str) -> Iterator[Dict[str, Any]]:
+            for checkpoint_id in ("cp-3", "cp-2", "cp-1"):
+                read.append(checkpoint_id)
+                yield {"checkpoint_id": checkpoint_id}
+
+    class ClosedSocket(io.BytesIO):
+        def write(self, data: bytes) -> int:  # type: ignore[override]
+            raise BrokenPipeError
+
+    monkeypatch.setattr(api_server, "_get_chat_manager", lambda: FakeManager())
+    actor = "user-123"
+    handler = _HistoryHandler(ClosedSocket())
+
+    ChatHandler._stream_thread_history(  # type: ignore[arg-type]
+        handler, f"{_thread_prefix_for_actor(actor)}-abc", actor_id=actor
+    )
+
+    assert handler.responses == [200]
+    assert read == ["cp-3"]
+
+
+@pytest.mark.parametrize(
+    ("path", "streamed"),
+    [
+        ("/threads/t-1/history?format=ndjson", True),
+        ("/threads/t-1/history?limit=5&format=ndjson", True),
+        ("/threads/t-1/history?xformat=ndjson", False),
+        ("/threads/t-1/history?format=ndjsonx", False),
+        ("/threads/t-1/history", False),
+    ],
+)
+def test_thread_history_ndjson_requires_exact_format_param(path: str, streamed: bool) -> None:
+    calls: List[str] = []
+    handler = SimpleNamespace(
+        path=path,
+        headers={},
+        _authorize_request=lambda: "user-123",
+        _stream_thread_history=lambda thread_id, actor_id: calls.append("stream"),
+        _handle_thread_history=lambda thread_id, actor_id: calls.append("json"),
+    )
+
+    ChatHandler.do_GET(handler)  # type: ignore[arg-type]
+
+    assert calls == (["stream"] if streamed else ["json"])
+
+
+def test_json_response_keeps_utf8_and_non_str_keys() -> None:
+    from law_shared.legal_tools.api_server import _json_response
+
+    body = _json_response({"answer": "근로시간 면제", 1: "one", "big": 2**70})
+
+    assert "근로시간 면제".encode("utf-8") in body
+    assert json.loads(body) == {"answer": "근로시간 면제", "1": "one", "big": 2**70}
@@ -8,6 +8,12 @@ Historically the shared Python utilities lived under a top-level
 new namespace. This module makes the ``law_shared`` sources available
 on ``sys.path`` and aliases its subpackages to their historical import
 paths.
+
+Importing this wrapper (or a legacy subpackage through it) does not load
+``.env``; subpackages are loaded straight from the ``law_shared`` sources
+and ``law_shared`` itself may never be imported. Legacy entry points that
+rely on ``.env`` settings (OpenSearch, LangSmith, ...) should call
+``packages.load_env()`` before using them.
 """
 
 from __future__ import annotations
@@ -23,7 +29,8 @@ if _PY_SHARED_SRC.exists():
     _shared_path = str(_PY_SHARED_SRC)
     if _shared_path not in sys.path:
         # Ensure the in-repo ``law_shared`` sources are importable even when
-        # the package is not installed into the environment yet.
+        # the package is not installed into the environment yet. This stays
+        # eager: aliased subpackages use absolute ``law_shared.`` imports.
         sys.path.insert(0, _shared_path)
 
     _legacy_path = str(_PY_SHARED_SRC / "law_shared")
@@ -37,8 +44,15 @@ if _legacy_path is not None:
 if __spec__ is not None:
     __spec__.submodule_search_locations = __path__
 
-law_shared = importlib.import_module("law_shared")
-load_env = getattr(law_shared, "load_env")
-load_env()
-
 __all__ = ["load_env"]
+
+
+def __getattr__(name: str):
+    # Resolve ``law_shared`` (and with it ``load_env``) on first use rather
+    # than at import time.
+    if name in {"law_shared", "load_env"}:
+        law_shared = importlib.import_module("law_shared")
+        globals()["law_shared"] = law_shared
+        globals()["load_env"] = law_shared.load_env
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
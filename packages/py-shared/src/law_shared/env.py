@@ -30,6 +30,8 @@ except ImportError:  # pragma: no cover - fallback when python-dotenv is missing
 
 PathLike = Union[str, Path]
 _LOADED = False
+# Resolved once: walking up from this file is the same on every call.
+_MODULE_PARENTS = Path(__file__).resolve().parents
 
 
 def load_env(*, override: bool = False, extra_paths: Iterable[PathLike] | None = None) -> bool:
@@ -65,14 +67,16 @@ def load_env(*, override: bool = False, extra_paths: Iterable[PathLike] | None =
 
     found = find_dotenv(usecwd=True)
     if found:
+        # find_dotenv only returns files that exist.
         resolved = Path(found).resolve()
-        if resolved not in loaded_paths and resolved.exists():
+        if resolved not in loaded_paths:
             loaded_paths.add(resolved)
             loaded_any = load_dotenv(resolved, override=override) or loaded_any
 
-    repo_root = next((p for p in Path(__file__).resolve().parents if (p / '.env').exists()), None)
-    repo_dotenv = repo_root / '.env' if repo_root else None
-    if repo_dotenv and repo_dotenv.exists():
+    repo_dotenv = next(
+        (p / ".env" for p in _MODULE_PARENTS if (p / ".env").exists()), None
+    )
+    if repo_dotenv is not None:
         resolved = repo_dotenv.resolve()
         if resolved not in loaded_paths:
             loaded_paths.add(resolved)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from argparse import _SubParsersAction, Namespace
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -60,6 +61,7 @@ def _pg_require() -> None:
         ) from exc
 
 
+@lru_cache(maxsize=8)
 def _normalize_dsn(dsn: str) -> str:
     if "://" in dsn:
         parsed = urlparse(dsn)
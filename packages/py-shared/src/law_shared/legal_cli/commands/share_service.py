@@ -5,6 +5,7 @@ from __future__ import annotations
 from argparse import _SubParsersAction, Namespace
 
 from ..config import RuntimeConfig
+from ..services import uvicorn_server_options
 
 __all__ = ["register", "run"]
 
@@ -37,4 +38,9 @@ def run(args: Namespace, config: RuntimeConfig) -> None:  # noqa: ARG001
             token_bytes=settings.token_bytes,
         )
     app = create_app(settings)
-    uvicorn.run(app, host=getattr(args, "host", "127.0.0.1"), port=int(getattr(args, "port", 8081)))
+    uvicorn.run(
+        app,
+        host=getattr(args, "host", "127.0.0.1"),
+        port=int(getattr(args, "port", 8081)),
+        **uvicorn_server_options(),
+    )
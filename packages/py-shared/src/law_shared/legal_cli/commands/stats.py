@@ -2,51 +2,212 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import sqlite3
 from argparse import _SubParsersAction, Namespace
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ..config import RuntimeConfig
-from ..services import iter_json_files, load_record
+from ..services import iter_json_files, load_stats_fields
 
 __all__ = ["register", "run"]
 
+# Below this many files the process pool start-up costs more than it saves.
+_PARALLEL_MIN_FILES = 256
+_CHUNKSIZE = 64
+# Uncached scans hand each worker this many paths and get one summary back.
+_REDUCE_CHUNK = 1024
+
+_CACHE_DIR_ENV = "LAW_STATS_CACHE_DIR"
+
+StatsRow = Tuple[str, str, int]
+
 
 def register(subparsers: _SubParsersAction) -> None:
     parser = subparsers.add_parser("stats", help="Show simple dataset statistics")
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Re-parse every file instead of reusing the per-dataset stats cache",
+    )
     parser.set_defaults(handler=run)
 
 
-def run(_: Namespace, config: RuntimeConfig) -> None:
-    total = 0
-    institutes: dict[str, int] = {}
-    task_types: dict[str, int] = {}
-    max_title_len = 0
+@dataclass
+class _Summary:
+    total: int = 0
+    institutes: Counter[str] = field(default_factory=Counter)
+    task_types: Counter[str] = field(default_factory=Counter)
+    max_title_len: int = 0
 
-    for path in iter_json_files(config.data_dir):
-        record = load_record(path)
-        if not record:
-            continue
-        total += 1
-        inst = (record.info.get("response_institute") or "").strip()
+    def add(self, row: Optional[StatsRow]) -> None:
+        if row is None:
+            return
+        inst, task_type, title_len = row
+        self.total += 1
         if inst:
-            institutes[inst] = institutes.get(inst, 0) + 1
-        task_type = (record.info.get("taskType") or "").strip()
+            self.institutes[inst] += 1
         if task_type:
-            task_types[task_type] = task_types.get(task_type, 0) + 1
-        max_title_len = max(max_title_len, len(record.title))
-
-    print(f"Records: {total}")
-    if institutes:
-        top_inst = sorted(institutes.items(), key=lambda item: item[1], reverse=True)[
-            :5
-        ]
+            self.task_types[task_type] += 1
+        if title_len > self.max_title_len:
+            self.max_title_len = title_len
+
+    def merge(self, other: "_Summary") -> None:
+        self.total += other.total
+        self.institutes.update(other.institutes)
+        self.task_types.update(other.task_types)
+        self.max_title_len = max(self.max_title_len, other.max_title_len)
+
+
+def _extract_chunk(paths: List[Path]) -> _Summary:
+    """Parse *paths* and reduce them to a single summary inside the worker."""
+
+    summary = _Summary()
+    for path in paths:
+        summary.add(load_stats_fields(path))
+    return summary
+
+
+def _cache_path(data_dir: Path) -> Path:
+    """Return the stats cache file for *data_dir* under the user cache dir.
+
+    The dataset directory is often tracked in git, so the cache lives in
+    ``$LAW_STATS_CACHE_DIR`` or ``$XDG_CACHE_HOME/law`` (``~/.cache/law``),
+    one file per resolved dataset path.
+    """
+
+    base = os.getenv(_CACHE_DIR_ENV)
+    if not base:
+        xdg = os.getenv("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+        base = os.path.join(xdg, "law")
+    digest = hashlib.blake2b(
+        os.fsencode(data_dir.resolve()), digest_size=8
+    ).hexdigest()
+    return Path(base).expanduser() / f"stats-{digest}.sqlite"
+
+
+def _open_cache(data_dir: Path) -> Optional[sqlite3.Connection]:
+    """Open the per-dataset stats cache, or ``None`` if it cannot be written."""
+
+    path = _cache_path(data_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path)
+    except (OSError, sqlite3.Error):
+        return None
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS stats_cache ("
+            " path TEXT PRIMARY KEY,"
+            " mtime_ns INTEGER NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " institute TEXT,"
+            " task_type TEXT,"
+            " title_len INTEGER)"
+        )
+    except sqlite3.Error:
+        conn.close()
+        return None
+    return conn
+
+
+def _parse(paths: List[Path]) -> Iterable[Optional[StatsRow]]:
+    if len(paths) < _PARALLEL_MIN_FILES:
+        yield from map(load_stats_fields, paths)
+        return
+    with ProcessPoolExecutor() as pool:
+        yield from pool.map(load_stats_fields, paths, chunksize=_CHUNKSIZE)
+
+
+def _summarize_uncached(paths: List[Path]) -> _Summary:
+    if len(paths) < _PARALLEL_MIN_FILES:
+        return _extract_chunk(paths)
+    summary = _Summary()
+    chunks = [
+        paths[i : i + _REDUCE_CHUNK] for i in range(0, len(paths), _REDUCE_CHUNK)
+    ]
+    with ProcessPoolExecutor() as pool:
+        # ``map`` yields in submission order, so keys keep first-seen order
+        # and ties in ``most_common`` come out as in a serial scan.
+        for partial in pool.map(_extract_chunk, chunks):
+            summary.merge(partial)
+    return summary
+
+
+def _collect_rows(
+    paths: List[Path], data_dir: Path, conn: sqlite3.Connection
+) -> List[Optional[StatsRow]]:
+    """Return one stats row per path, re-parsing only files the cache lacks."""
+
+    cached: Dict[str, Tuple[int, int, Optional[StatsRow]]] = {}
+    for key, mtime_ns, size, inst, task_type, title_len in conn.execute(
+        "SELECT path, mtime_ns, size, institute, task_type, title_len FROM stats_cache"
+    ):
+        row = None if title_len is None else (inst, task_type, title_len)
+        cached[key] = (mtime_ns, size, row)
+
+    rows: List[Optional[StatsRow]] = [None] * len(paths)
+    stale: List[Tuple[int, str, int, int]] = []
+    for idx, path in enumerate(paths):
+        key = str(path.relative_to(data_dir))
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        hit = cached.pop(key, None)
+        if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+            rows[idx] = hit[2]
+        else:
+            stale.append((idx, key, st.st_mtime_ns, st.st_size))
+
+    updates = []
+    for (idx, key, mtime_ns, size), row in zip(
+        stale, _parse([paths[item[0]] for item in stale])
+    ):
+        rows[idx] = row
+        inst, task_type, title_len = row if row is not None else (None, None, None)
+        updates.append((key, mtime_ns, size, inst, task_type, title_len))
+
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO stats_cache VALUES (?, ?, ?, ?, ?, ?)", updates
+            )
+            # Whatever is left in ``cached`` belongs to files that were removed.
+            conn.executemany(
+                "DELETE FROM stats_cache WHERE path = ?", [(key,) for key in cached]
+            )
+    except sqlite3.Error:
+        pass  # the cache is an optimisation; a failed write only costs a re-parse
+    return rows
+
+
+def run(args: Namespace, config: RuntimeConfig) -> None:
+    paths = list(iter_json_files(config.data_dir))
+    conn = None if getattr(args, "no_cache", False) else _open_cache(config.data_dir)
+    if conn is None:
+        summary = _summarize_uncached(paths)
+    else:
+        summary = _Summary()
+        try:
+            for row in _collect_rows(paths, config.data_dir, conn):
+                summary.add(row)
+        finally:
+            conn.close()
+
+    print(f"Records: {summary.total}")
+    if summary.institutes:
         print("Top Institutes:")
-        for name, count in top_inst:
+        for name, count in summary.institutes.most_common(5):
             print(f"- {name}: {count}")
-    if task_types:
-        top_task_types = sorted(
-            task_types.items(), key=lambda item: item[1], reverse=True
-        )
+    if summary.task_types:
         print("Task Types:")
-        for name, count in top_task_types:
+        for name, count in summary.task_types.most_common():
             print(f"- {name}: {count}")
-    print(f"Max title length: {max_title_len}")
+    print(f"Max title length: {summary.max_title_len}")
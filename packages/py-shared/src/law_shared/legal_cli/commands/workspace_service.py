@@ -1,12 +1,14 @@
 """CLI command for workspace API server."""
 
-import uvicorn
+from ..services import uvicorn_server_options
 
 
 def run(args, runtime):
     """Start the workspace API server."""
     from law_shared.legal_tools.workspace import WorkspaceSettings, create_app
 
+    import uvicorn
+
     settings = WorkspaceSettings.from_env()
     app = create_app(settings)
 
@@ -17,7 +19,14 @@ def run(args, runtime):
     print(f"🚀 Starting Workspace API server on http://{host}:{port}")
     print(f"📚 API docs at http://{host}:{port}/docs")
 
-    uvicorn.run(app, host=host, port=port, reload=reload, log_level="info")
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        reload=reload,
+        log_level="info",
+        **uvicorn_server_options(),
+    )
 
 
 def register(subparsers):
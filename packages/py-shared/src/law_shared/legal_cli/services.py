@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:  # Optional fast JSON decoder for dataset scans; stdlib json is the fallback
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
 
 
 @dataclass
@@ -41,12 +48,29 @@ class Record:
         return "\n".join(segment for segment in parts if segment)
 
 
+def _walk_json(directory: str) -> Iterator[str]:
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: List[str] = []
+    for entry in entries:
+        # ``DirEntry`` caches d_type, so neither check costs a stat() for
+        # regular files; symlinked directories are not followed, as in rglob.
+        if entry.is_dir(follow_symlinks=False):
+            subdirs.append(entry.path)
+        elif entry.name.endswith(".json") and entry.is_file():
+            yield entry.path
+    for subdir in subdirs:
+        yield from _walk_json(subdir)
+
+
 def iter_json_files(root: Path) -> Iterator[Path]:
     """Yield JSON files from *root* recursively."""
 
-    for path in root.rglob("*.json"):
-        if path.is_file():
-            yield path
+    for path in _walk_json(os.fspath(root)):
+        yield Path(path)
 
 
 def load_record(path: Path) -> Optional[Record]:
@@ -63,6 +87,51 @@ def load_record(path: Path) -> Optional[Record]:
     return Record(path=path, info=info, taskinfo=taskinfo)
 
 
+def load_stats_fields(path: Path) -> Optional[Tuple[str, str, int]]:
+    """Return ``(institute, task_type, title_len)`` for *path* or ``None``.
+
+    ``stats`` only needs three scalars per file, so this skips building a
+    :class:`Record` and decodes with orjson when it is installed.
+    """
+
+    try:
+        raw = path.read_bytes()
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN literals or integers beyond 64 bits
+        if data is None:
+            data = json.loads(raw.decode("utf-8"))
+    except Exception:
+        return None
+
+    info = data.get("info", {}) or {}
+    # Institutes and task types repeat across thousands of files; interning
+    # lets pickle emit back-references when rows cross the process pool.
+    return (
+        sys.intern((info.get("response_institute") or "").strip()),
+        sys.intern((info.get("taskType") or "").strip()),
+        len(str(info.get("title", ""))),
+    )
+
+
+def uvicorn_server_options() -> Dict[str, str]:
+    """Return uvicorn ``loop``/``http`` options, preferring uvloop and httptools.
+
+    Both ship with ``uvicorn[standard]``; when either is missing we fall back to
+    uvicorn's ``auto`` selection so plain installs keep working.
+    """
+
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    has_httptools = importlib.util.find_spec("httptools") is not None
+    return {
+        "loop": "uvloop" if has_uvloop else "auto",
+        "http": "httptools" if has_httptools else "auto",
+    }
+
+
 def enable_offline_mode(flag: bool) -> None:
     """Set environment variable hooks for offline execution."""
 
@@ -1,46 +1,47 @@
 """Lightweight namespace for legal tools.
 
 Avoid importing heavy dependencies at package import time to keep optional
-features (like the LangGraph agent) usable without extra installs.
+features (like the LangGraph agent) usable without extra installs. Re-exported
+names resolve on first access (PEP 562), so importing a submodule such as
+``tracing`` no longer loads LangGraph or pydantic.
 """
 
-__all__ = []
-
-try:  # pragma: no cover - optional dependency (LangGraph + Postgres)
-    from .multi_turn_chat import (  # type: ignore
-        ChatResponse as ChatResponse,
-        PostgresChatConfig as PostgresChatConfig,
-        PostgresChatManager as PostgresChatManager,
-    )
-
-    __all__.extend(
-        [
-            "ChatResponse",
-            "PostgresChatConfig",
-            "PostgresChatManager",
-        ]
-    )
-except Exception:
-    pass
-
-# Expose contextual_rag symbols lazily if dependencies are available
-try:  # pragma: no cover - optional import
-    from .contextual_rag import (  # type: ignore
-        ContextConfig as ContextConfig,
-        ContextualChunker as ContextualChunker,
-        EmbeddingModel as EmbeddingModel,
-        IndexRecord as IndexRecord,
-    )
-
-    __all__.extend(
-        [
-            "ContextConfig",
-            "ContextualChunker",
-            "EmbeddingModel",
-            "IndexRecord",
-        ]
-    )
-except Exception:
-    # Optional module not available (e.g., missing pydantic).
-    # This keeps `law_shared.legal_tools` importable for other features like pg_search/agent_graph.
-    pass
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    # optional dependency (LangGraph + Postgres)
+    "ChatResponse": ".multi_turn_chat",
+    "PostgresChatConfig": ".multi_turn_chat",
+    "PostgresChatManager": ".multi_turn_chat",
+    # optional dependency (pydantic)
+    "ContextConfig": ".contextual_rag",
+    "ContextualChunker": ".contextual_rag",
+    "EmbeddingModel": ".contextual_rag",
+    "IndexRecord": ".contextual_rag",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:  # pragma: no cover - thin import shim
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = import_module(module_name, __name__)
+    except ImportError as exc:
+        # Keep ``hasattr``/``from ... import`` behaving as if the optional
+        # export were simply absent.
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({exc})"
+        ) from exc
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pragma: no cover - introspection helper
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import heapq
 import json
 import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 try:  # pragma: no cover - optional dependency fallback
     import structlog
@@ -237,7 +250,7 @@ def _should_fallback_provider(err: Exception) -> bool:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Hit:
     """A retrieval hit with minimal fields for synthesis and citation."""
 
@@ -262,6 +275,9 @@ class EvidenceStore:
         self.context_chars = max(0, int(context_chars))
         self._items: List[Tuple[int, Hit]] = []
         self._seen: set[Tuple[str, str, str]] = set()
+        # Rank scores only depend on the hit and the fixed focus terms, so they
+        # are computed once on insert instead of on every rerank.
+        self._scores: Dict[Tuple[str, str, str], float] = {}
         self._ranked_dirty = False
         self.queries: List[str] = []
         self.actions: List[Dict[str, Any]] = []
@@ -279,10 +295,11 @@ class EvidenceStore:
     def add_hits(self, hits: Sequence[Hit]) -> str:
         formatted: List[str] = []
         for hit in hits:
-            key = (hit.doc_id, str(hit.path), hit.snippet[:160])
+            key = self._hit_key(hit)
             if key in self._seen:
                 continue
             self._seen.add(key)
+            self._scores[key] = _hit_rank_score(hit, self.focus_terms)
             idx = len(self._items) + 1
             self._items.append((idx, hit))
             formatted.append(self._format_hit(idx, hit))
@@ -291,6 +308,10 @@ class EvidenceStore:
             return "검색 결과가 없습니다."
         return "\n".join(formatted)
 
+    @staticmethod
+    def _hit_key(hit: Hit) -> Tuple[str, str, str]:
+        return (hit.doc_id, str(hit.path), hit.snippet[:160])
+
     def _format_hit(self, idx: int, hit: Hit) -> str:
         snippet = re.sub(r"\s+", " ", hit.snippet.strip())
         if len(snippet) > 380:
@@ -360,7 +381,7 @@ class EvidenceStore:
 
     def _rerank_items(self) -> None:
         ranked: List[Tuple[float, Hit]] = [
-            (_hit_rank_score(hit, self.focus_terms), hit) for _, hit in self._items
+            (self._scores[self._hit_key(hit)], hit) for _, hit in self._items
         ]
         ranked.sort(key=lambda item: item[0], reverse=True)
         if self.focus_terms and any(score > 0 for score, _ in ranked):
@@ -882,15 +903,38 @@ def _keyword_search(
     return hits
 
 
-def _local_keyword_search(query: str, limit: int, data_dir: Path) -> List[Hit]:
-    meili_dir = data_dir / "meilisearch"
-    if not meili_dir.exists():
-        return []
+@dataclass(frozen=True, slots=True)
+class _LocalDoc:
+    """Pre-parsed local corpus entry used by the keyword fallback."""
 
-    variants = _query_variants(query)
-    signal_tokens = _query_signal_tokens(query)
-    scored: List[tuple[int, Hit]] = []
-    for path in sorted(meili_dir.glob("*.json")):
+    path: Path
+    doc_id: str
+    title: str
+    compact_haystack: str
+    snippet: str
+
+
+_LOCAL_CORPUS_CACHE: Dict[Path, Tuple[Tuple[Tuple[str, int, int], ...], List[_LocalDoc]]] = {}
+
+
+def _load_local_corpus(meili_dir: Path) -> List[_LocalDoc]:
+    """Parse ``meili_dir`` once and reuse it until any file changes."""
+
+    paths = sorted(meili_dir.glob("*.json"))
+    signature: List[Tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    key = tuple(signature)
+    cached = _LOCAL_CORPUS_CACHE.get(meili_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    docs: List[_LocalDoc] = []
+    for path in paths:
         try:
             payload = json.loads(path.read_text(encoding="utf-8"))
         except Exception:
@@ -909,38 +953,93 @@ def _local_keyword_search(query: str, limit: int, data_dir: Path) -> List[Hit]:
         haystack = " ".join(part for part in haystack_parts if part).strip()
         if not haystack:
             continue
-        compact_haystack = _compact_search_text(haystack)
+        docs.append(
+            _LocalDoc(
+                path=path,
+                doc_id=str(info.get("doc_id") or path.stem),
+                title=title,
+                compact_haystack=_compact_search_text(haystack),
+                snippet=str(
+                    taskinfo.get("output") or info.get("summary") or haystack
+                )[:1200],
+            )
+        )
+    _LOCAL_CORPUS_CACHE[meili_dir] = (key, docs)
+    return docs
+
+
+def preload_local_corpus(data_dir: Path) -> int:
+    """Parse the local keyword fallback corpus ahead of the first search.
+
+    Returns the number of cached documents (0 when the directory is absent).
+    """
+
+    meili_dir = data_dir / "meilisearch"
+    if not meili_dir.exists():
+        return 0
+    return len(_load_local_corpus(meili_dir))
+
+
+def _local_keyword_search(query: str, limit: int, data_dir: Path) -> List[Hit]:
+    meili_dir = data_dir / "meilisearch"
+    if not meili_dir.exists():
+        return []
+
+    terms, signal_set = _query_term_table(query)
+    scored: List[tuple[int, _LocalDoc]] = []
+    for doc in _load_local_corpus(meili_dir):
+        compact_haystack = doc.compact_haystack
         score = 0
         matched_signal = False
-        for variant in variants:
-            if variant and variant in compact_haystack:
-                score += max(1, len(variant))
-        for token in signal_tokens:
-            if token in compact_haystack:
-                matched_signal = True
-                score += max(2, len(token) * 2)
+        for term, weight in terms:
+            if term in compact_haystack:
+                score += weight
+                if term in signal_set:
+                    matched_signal = True
         if score == 0:
             continue
-        if signal_tokens and not matched_signal:
+        if signal_set and not matched_signal:
             continue
-        snippet = str(taskinfo.get("output") or info.get("summary") or haystack)[:1200]
-        scored.append(
-            (
-                score,
-                Hit(
-                    source="keyword",
-                    path=path,
-                    doc_id=str(info.get("doc_id") or path.stem),
-                    title=title,
-                    score=float(score),
-                    snippet=snippet,
-                    page_index=1,
-                    page_total=1,
-                ),
-            )
+        scored.append((score, doc))
+    # Partial top-k selection instead of sorting every match; Hit objects are
+    # only built for the survivors.
+    top = heapq.nsmallest(
+        max(1, limit), scored, key=lambda item: (-item[0], item[1].title)
+    )
+    return [
+        Hit(
+            source="keyword",
+            path=doc.path,
+            doc_id=doc.doc_id,
+            title=doc.title,
+            score=float(score),
+            snippet=doc.snippet,
+            page_index=1,
+            page_total=1,
         )
-    scored.sort(key=lambda item: (-item[0], item[1].title))
-    return [hit for _, hit in scored[: max(1, limit)]]
+        for score, doc in top
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _query_term_table(
+    query: str,
+) -> Tuple[Tuple[Tuple[str, int], ...], FrozenSet[str]]:
+    """Return ``(term, weight)`` pairs and the signal-term set for *query*.
+
+    Signal tokens are usually also variants; both weights are folded into one
+    table so each distinct term is searched for once per document. The agent
+    repeats the same queries across turns, so the table is memoised.
+    """
+
+    term_weights: Dict[str, int] = {}
+    for variant in _query_variants(query):
+        if variant:
+            term_weights[variant] = term_weights.get(variant, 0) + max(1, len(variant))
+    signal_tokens = _query_signal_tokens(query)
+    for token in signal_tokens:
+        term_weights[token] = term_weights.get(token, 0) + max(2, len(token) * 2)
+    return tuple(term_weights.items()), frozenset(signal_tokens)
 
 
 def _query_variants(query: str) -> List[str]:
@@ -959,15 +1058,16 @@ def _query_variants(query: str) -> List[str]:
     return variants
 
 
-def _query_signal_tokens(query: str) -> List[str]:
+@lru_cache(maxsize=1024)
+def _query_signal_tokens(query: str) -> Tuple[str, ...]:
     raw_tokens = [token.strip() for token in re.split(r"\s+", query) if token.strip()]
     compact_tokens = []
     for token in raw_tokens:
         compact = _compact_search_text(token)
         if compact and compact not in compact_tokens:
             compact_tokens.append(compact)
-    strong = [token for token in compact_tokens if len(token) >= 3]
-    return strong or compact_tokens
+    strong = tuple(token for token in compact_tokens if len(token) >= 3)
+    return strong or tuple(compact_tokens)
 
 
 def _hit_rank_score(hit: Hit, focus_terms: Sequence[str]) -> float:
@@ -1058,10 +1158,14 @@ def _offline_summary(question: str, observations: str) -> str:
             "증거 스니펫이 필요합니다. 스니펫을 제공하거나 데이터 인덱스를 점검하세요. [일반지식]\n\n"
             "# 출처 및 메타데이터\n(번호 없음)"
         )
-    lines = [ln.strip() for ln in obs.splitlines() if ln.strip()]
     quotes: List[str] = []
     refs: List[int] = []
-    for ln in lines:
+    # Only the first two non-empty lines are used, so stop there instead of
+    # stripping every observation line up front.
+    for raw_line in obs.splitlines():
+        ln = raw_line.strip()
+        if not ln:
+            continue
         if ln.startswith("[") and "]" in ln:
             try:
                 num = int(ln[1 : ln.index("]")])
@@ -1074,23 +1178,23 @@ def _offline_summary(question: str, observations: str) -> str:
     ref_list = ", ".join(f"[{n}]" for n in sorted(set(refs))[:5]) or "(번호 없음)"
     q1 = quotes[0] if quotes else ""
     q2 = quotes[1] if len(quotes) > 1 else ""
-    body = (
+    parts = [
         "# 사건 정보\n(스니펫 기반; 추가 메타데이터 미상)\n\n"
         "# 요약\n"
         "관측된 스니펫을 바탕으로 핵심을 간단히 정리합니다. 상세한 법리 해설은 스니펫 범위 내에서만 제시합니다.\n\n"
         "# 법원 판단(핵심)\n"
-    )
+    ]
     if q1:
-        body += f'"{q1}"\n'
+        parts.append(f'"{q1}"\n')
     if q2:
-        body += f'"{q2}"\n'
-    body += (
+        parts.append(f'"{q2}"\n')
+    parts.append(
         "\n# 결론\n"
         "위 스니펫 범위에서 파악되는 내용을 요약했습니다. 추가 근거가 있으면 정확도가 향상됩니다.\n\n"
         "# 출처 및 메타데이터\n"
-        f"{ref_list}"
     )
-    return body
+    parts.append(ref_list)
+    return "".join(parts)
 
 
 class LangChainToolAgent:
@@ -1287,16 +1391,26 @@ class LangChainToolAgent:
         return bool(re.search(r"\[\d+\]", answer or ""))
 
     def _bootstrap_offline(self, question: str, store: EvidenceStore) -> None:
-        seeds = _seed_queries(question) or ([question] if question else [])
-        for q in seeds[:3]:
+        seeds = (_seed_queries(question) or ([question] if question else []))[:3]
+        if not seeds:
+            return
+
+        def _search(q: str) -> List[Hit]:
+            return tool_keyword_search(
+                query=q,
+                k=max(self.top_k, 5),
+                data_dir=self.data_dir,
+                context_chars=self.context_chars,
+            )
+
+        # Seed searches are independent network calls, so issue them together
+        # and consume the results in seed order.
+        with ThreadPoolExecutor(max_workers=len(seeds)) as executor:
+            futures = [executor.submit(_search, q) for q in seeds]
+        for q, future in zip(seeds, futures):
             store.record_query(q)
             try:
-                hits = tool_keyword_search(
-                    query=q,
-                    k=max(self.top_k, 5),
-                    data_dir=self.data_dir,
-                    context_chars=self.context_chars,
-                )
+                hits = future.result()
             except Exception as exc:
                 logger.exception("offline_bootstrap_failed", query=q)
                 store.record_action("keyword_search", {"query": q, "error": str(exc)})
@@ -1317,30 +1431,9 @@ class LangChainToolAgent:
         self, question: str, store: EvidenceStore, *, provider: Optional[str] = None
     ) -> Dict[str, Any]:
         from langchain.agents import AgentExecutor, create_tool_calling_agent  # type: ignore
-        from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder  # type: ignore
 
         tools = self._build_tools(store)
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """
-당신은 한국어 법률 리서치 에이전트입니다. 제공된 도구를 사용하여 질문에 대한 근거 기반 답변을 작성하세요.
-도구 목록:
-- keyword_search: OpenSearch 인덱스를 사용하여 관련 판례/문서를 찾습니다. 반드시 최소 한 번은 사용해야 합니다.
-- law_statute_search: law.go.kr 법령 검색 API로 법령명·공포일자 등 메타데이터를 확인합니다.
-- law_statute_detail: law.go.kr 법령 본문 조회 API로 특정 조문 내용을 살펴봅니다.
-- law_interpretation_search: law.go.kr 법령해석례 검색 API로 질의·회답 사례를 찾습니다.
-- law_interpretation_detail: law.go.kr 법령해석례 본문 조회 API로 질의요지와 회답을 확인합니다.
-도구는 `[번호]`가 붙은 스니펫을 반환하며, 최종 답변의 모든 주장에는 해당 번호를 인용하세요.
-{general_guidance}
-불필요한 사설을 피하고, 간결한 마크다운 구조로 사건 정보·요약·법원 판단·결론을 제시하세요.
-""".strip(),
-                ),
-                ("user", "질문: {input}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ]
-        )
+        prompt = _agent_prompt()
 
         temperature = 0.0
         try:
@@ -1946,26 +2039,7 @@ class LangChainToolAgent:
             )
             return _offline_summary(question, observations)
 
-        from langchain.prompts import ChatPromptTemplate  # type: ignore
-
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """
-당신은 법률 리서치 요약가입니다. 주어진 스니펫만 근거로 한국어 요약을 작성하세요.
-- 사건 정보, 요약, 법원 판단(핵심), 결론, 출처 및 메타데이터 순으로 마크다운 섹션을 구성합니다.
-- 각 주장에는 [번호] 형태의 인용을 포함합니다.
-- 근거가 부족하면 간단히 한계를 언급하세요.
-""".strip(),
-                ),
-                (
-                    "user",
-                    "질문: {question}\n\n스니펫:\n{observations}\n\n지침: {guidance}",
-                ),
-            ]
-        )
-
+        prompt = _summary_prompt()
         chain = prompt | llm  # type: ignore
         try:
             output = chain.invoke(
@@ -1992,6 +2066,58 @@ class LangChainToolAgent:
         return str(output)
 
 
+@lru_cache(maxsize=1)
+def _agent_prompt() -> Any:
+    # The templates are static; parsing them once avoids rebuilding the
+    # prompt on every agent run and provider fallback.
+    from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder  # type: ignore
+
+    return ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                """
+당신은 한국어 법률 리서치 에이전트입니다. 제공된 도구를 사용하여 질문에 대한 근거 기반 답변을 작성하세요.
+도구 목록:
+- keyword_search: OpenSearch 인덱스를 사용하여 관련 판례/문서를 찾습니다. 반드시 최소 한 번은 사용해야 합니다.
+- law_statute_search: law.go.kr 법령 검색 API로 법령명·공포일자 등 메타데이터를 확인합니다.
+- law_statute_detail: law.go.kr 법령 본문 조회 API로 특정 조문 내용을 살펴봅니다.
+- law_interpretation_search: law.go.kr 법령해석례 검색 API로 질의·회답 사례를 찾습니다.
+- law_interpretation_detail: law.go.kr 법령해석례 본문 조회 API로 질의요지와 회답을 확인합니다.
+도구는 `[번호]`가 붙은 스니펫을 반환하며, 최종 답변의 모든 주장에는 해당 번호를 인용하세요.
+{general_guidance}
+불필요한 사설을 피하고, 간결한 마크다운 구조로 사건 정보·요약·법원 판단·결론을 제시하세요.
+""".strip(),
+            ),
+            ("user", "질문: {input}"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _summary_prompt() -> Any:
+    from langchain.prompts import ChatPromptTemplate  # type: ignore
+
+    return ChatPromptTemplate.from_messages(
+        [
+            (
+                "system",
+                """
+당신은 법률 리서치 요약가입니다. 주어진 스니펫만 근거로 한국어 요약을 작성하세요.
+- 사건 정보, 요약, 법원 판단(핵심), 결론, 출처 및 메타데이터 순으로 마크다운 섹션을 구성합니다.
+- 각 주장에는 [번호] 형태의 인용을 포함합니다.
+- 근거가 부족하면 간단히 한계를 언급하세요.
+""".strip(),
+            ),
+            (
+                "user",
+                "질문: {question}\n\n스니펫:\n{observations}\n\n지침: {guidance}",
+            ),
+        ]
+    )
+
+
 def build_legal_ask_graph(
     *,
     data_dir: Path,
@@ -5,17 +5,24 @@ import hmac
 import json
 import logging
 import os
+import threading
 import time
 import uuid
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, urlparse
 
-from law_shared.legal_tools.agent_graph import run_ask
+from law_shared.legal_tools.agent_graph import preload_local_corpus, run_ask
 from law_shared.legal_tools.tracing import configure_langsmith, trace_run
 
+try:  # Optional fast JSON codec; the stdlib paths below stay the fallback
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 try:  # Optional dependency guard for multi-turn chat support
     from law_shared.legal_tools.multi_turn_chat import (
         ChatResponse,
@@ -34,13 +41,17 @@ logger.addHandler(logging.NullHandler())
 
 _CHAT_MANAGER: Optional[PostgresChatManager] = None
 _CHAT_MANAGER_ERROR: Optional[str] = None
+_CHAT_MANAGER_LOCK = threading.Lock()
 
 
 def _configured_api_key() -> str:
     return os.getenv("LAW_API_KEY") or os.getenv("LAW_SERVICE_API_KEY") or ""
 
 
+@lru_cache(maxsize=1024)
 def _thread_prefix_for_actor(actor_id: str) -> str:
+    # Called for every request (ownership check and new thread ids) with a
+    # small set of actors, so the digest is memoized.
     digest = hashlib.sha256(actor_id.encode("utf-8")).hexdigest()[:16]
     return f"thread-u-{digest}"
 
@@ -60,7 +71,22 @@ def _extract_question(messages: List[Dict[str, Any]]) -> str:
     return question
 
 
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            # Parses the UTF-8 body directly, skipping the intermediate str.
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN or huge ints; let the stdlib decoder decide
+    return json.loads(raw.decode("utf-8"))
+
+
 def _json_response(obj: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let the stdlib encoder handle it
     return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 
@@ -292,6 +318,18 @@ def _get_chat_manager() -> Optional[PostgresChatManager]:
         return _CHAT_MANAGER
     if _CHAT_MANAGER_ERROR:
         return None
+    with _CHAT_MANAGER_LOCK:
+        # Request threads and the startup warm-up may race here; only the
+        # first one builds the manager (and its connection pool).
+        if _CHAT_MANAGER is not None:
+            return _CHAT_MANAGER
+        if _CHAT_MANAGER_ERROR:
+            return None
+        return _init_chat_manager()
+
+
+def _init_chat_manager() -> Optional[PostgresChatManager]:
+    global _CHAT_MANAGER, _CHAT_MANAGER_ERROR
     try:
         config = PostgresChatConfig.from_env()
     except Exception as exc:  # pragma: no cover - env-specific config
@@ -329,7 +367,14 @@ class ChatHandler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         parts = [segment for segment in parsed.path.split("/") if segment]
         if len(parts) == 3 and parts[0] == "threads" and parts[2] == "history":
-            self._handle_thread_history(parts[1], actor_id=actor_id)
+            accept = self.headers.get("Accept") or ""
+            if (
+                "application/x-ndjson" in accept
+                or parse_qs(parsed.query).get("format") == ["ndjson"]
+            ):
+                self._stream_thread_history(parts[1], actor_id=actor_id)
+            else:
+                self._handle_thread_history(parts[1], actor_id=actor_id)
             return
         self.send_error(HTTPStatus.NOT_FOUND, "Unknown endpoint")
 
@@ -348,7 +393,11 @@ class ChatHandler(BaseHTTPRequestHandler):
             self.send_error(HTTPStatus.SERVICE_UNAVAILABLE, "LAW_API_KEY is not configured")
             return None
         scheme, _, token = (self.headers.get("Authorization") or "").partition(" ")
-        if scheme.lower() != "bearer" or not hmac.compare_digest(token, expected):
+        # Compare bytes so non-ASCII header values fail auth instead of
+        # making compare_digest raise TypeError.
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.encode("utf-8", "surrogatepass"), expected.encode("utf-8")
+        ):
             self.send_error(HTTPStatus.UNAUTHORIZED, "Authentication required")
             return None
         actor_id = (self.headers.get("X-Actor-ID") or "").strip()
@@ -366,7 +415,7 @@ class ChatHandler(BaseHTTPRequestHandler):
             length = 0
         raw = self.rfile.read(length) if length > 0 else b"{}"
         try:
-            req = json.loads(raw.decode("utf-8"))
+            req = _json_loads(raw)
         except Exception:
             self.send_error(HTTPStatus.BAD_REQUEST, "Invalid JSON body")
             return
@@ -670,7 +719,7 @@ class ChatHandler(BaseHTTPRequestHandler):
                     chunk = {
                         "id": chat_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {
@@ -691,7 +740,7 @@ class ChatHandler(BaseHTTPRequestHandler):
                     chunk_payload = {
                         "id": chat_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {
@@ -715,7 +764,7 @@ class ChatHandler(BaseHTTPRequestHandler):
                     chunk_payload = {
                         "id": chat_id,
                         "object": "chat.completion.chunk",
-                        "created": int(time.time()),
+                        "created": created,
                         "model": model,
                         "choices": [
                             {
@@ -738,7 +787,7 @@ class ChatHandler(BaseHTTPRequestHandler):
                 chunk = {
                     "id": chat_id,
                     "object": "chat.completion.chunk",
-                    "created": int(time.time()),
+                    "created": created,
                     "model": model,
                     "choices": [
                         {
@@ -780,7 +829,7 @@ class ChatHandler(BaseHTTPRequestHandler):
         final_chunk = {
             "id": chat_id,
             "object": "chat.completion.chunk",
-            "created": int(time.time()),
+            "created": created,
             "model": model,
             "choices": [
                 {"index": 0, "delta": {}, "finish_reason": "stop"},
@@ -821,6 +870,59 @@ class ChatHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(body)
 
+    def _stream_thread_history(self, thread_id: str, *, actor_id: str) -> None:
+        """Write thread history as NDJSON, one checkpoint per line.
+
+        Long threads start arriving as soon as the first checkpoint is read
+        instead of after the whole history has been materialized.
+        """
+
+        if not _thread_belongs_to_actor(thread_id, actor_id):
+            self.send_error(HTTPStatus.FORBIDDEN, "Thread does not belong to actor")
+            return
+        manager = _get_chat_manager()
+        if manager is None:
+            self.send_error(
+                HTTPStatus.SERVICE_UNAVAILABLE, "Multi-turn chat is not configured"
+            )
+            return
+        entries = manager.iter_history(thread_id)
+        try:
+            # Pull the first entry before committing to a 200 so invalid
+            # thread ids still map to 400.
+            first = next(entries, None)
+        except ValueError as exc:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(exc))
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if first is None or not self._ndjson_send(first):
+            return
+        try:
+            for entry in entries:
+                if not self._ndjson_send(entry):
+                    return
+        except Exception as exc:
+            # The 200 is already sent; end with an error line so the client
+            # can tell a failed read from a complete history.
+            logger.exception(
+                "thread_history_stream_failed",
+                exc_info=exc,
+                extra={"thread_id": thread_id},
+            )
+            self._ndjson_send({"error": "Failed to read thread history"})
+
+    def _ndjson_send(self, obj: Dict[str, Any]) -> bool:
+        try:
+            self.wfile.write(_json_response(obj) + b"\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # Client disconnected
+            return False
+        return True
+
     def _collect_tool_usage(
         self,
         *,
@@ -853,9 +955,9 @@ class ChatHandler(BaseHTTPRequestHandler):
         return payload or None
 
     def _sse_send(self, obj: Dict[str, Any]) -> None:
-        data = json.dumps(obj, ensure_ascii=False)
+        data = _json_response(obj)
         try:
-            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: " + data + b"\n\n")
             self.wfile.flush()
         except Exception:
             # Client disconnected
@@ -873,9 +975,29 @@ def _merge_agent_payload(
             law_payload[key] = value
 
 
+def _warm_local_corpus() -> None:
+    data_dir = Path(os.getenv("LAW_DATA_DIR") or "data")
+    try:
+        documents = preload_local_corpus(data_dir)
+    except Exception as exc:  # pragma: no cover - corrupt corpus files
+        logger.warning("local_corpus_preload_failed", extra={"error": str(exc)})
+        return
+    logger.info("local_corpus_preload_done", extra={"documents": documents})
+
+
 def serve(host: str = "127.0.0.1", port: int = 8080) -> None:
     configure_langsmith()
     server = ThreadingHTTPServer((host, port), ChatHandler)
+    # Connect the chat checkpointer in the background so the socket accepts
+    # requests immediately instead of waiting on Postgres.
+    threading.Thread(
+        target=_get_chat_manager, name="chat-manager-warmup", daemon=True
+    ).start()
+    # Parse the offline keyword corpus up front as well, so the first
+    # fallback search does not pay for it.
+    threading.Thread(
+        target=_warm_local_corpus, name="local-corpus-warmup", daemon=True
+    ).start()
     print(f"[law] OpenAI-compatible server listening on http://{host}:{port}")
     print("  POST /v1/chat/completions  {model, messages, stream}")
     try:
@@ -3,12 +3,25 @@ from __future__ import annotations
 import hashlib
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Protocol, Sequence, Tuple
+from typing import Dict, List, Optional, Protocol, Sequence, Tuple
 
 from pydantic import BaseModel
 
 from law_shared.legal_schemas import Anchor, Chunk, Document, Section, SourceType
 
+# Splitters and extractors run for every section/chunk during indexing.
+_STATUTE_PARA_RE = re.compile(r"(?=\s*제\d+(?:항|호))")
+_NUMBERED_PARA_RE = re.compile(r"(?=\n\s*(?:\(\d+\)|\d+\.|\d+\)\s))")
+_CONTRACT_CLAUSE_RE = re.compile(r"(?=\n\s*(?:\d+(?:\.\d+)*\)|\d+(?:\.\d+)*\.|제\d+조))")
+_PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?\u3002\uFF0E])\s+|\n+")
+_FIRST_LABEL_RE = re.compile(r"제\d+조[^\n]*|제\d+항|제\d+호|\b주문\b|\b이유\b")
+_KEYWORD_TERM_RE = re.compile(r"민법|형법|상법|행정|지재|제\d+조")
+_KEYWORD_NUMBER_RE = re.compile(r"\b\d{2,}[가-힣]?\b")
+_STATUTE_CITE_RE = re.compile(r"(?:민법|형법|상법|민사소송법)?\s*제\s*\d+\s*조")
+_CASE_ID_RE = re.compile(r"\b\d{4}[가-힣]{1}\d{3,6}\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class ContextConfig(BaseModel):
     """Configuration knobs for chunking and contextual enrichment.
@@ -23,6 +36,9 @@ class ContextConfig(BaseModel):
     contract_chunk_tokens: Tuple[int, int] = (200, 400)
     contract_overlap: int = 50
     context_prefix_tokens: int = 160
+    # Texts per embedder call. Batches are formed from length-sorted texts so
+    # each call pads to a similar sequence length; <= 0 sends a single batch.
+    embed_batch_size: int = 32
 
 
 class EmbeddingModel(Protocol):
@@ -39,7 +55,7 @@ class EmbeddingModel(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IndexRecord:
     """A flattened, index-ready record for a chunk.
 
@@ -103,9 +119,15 @@ class ContextualChunker:
         contextuals = [c.contextualized_text or c.chunk_text for c in chunks]
         embeddings: Optional[List[List[float]]] = None
         if embedder:
-            embeddings = embedder.embed(contextuals)
+            embeddings = _embed_length_bucketed(
+                embedder, contextuals, self.cfg.embed_batch_size
+            )
             assert len(embeddings) == len(chunks)
 
+        # Per-document values are resolved once instead of for every chunk.
+        doc_version = document.version
+        source_type = document.source_type.value
+        embedding_model = embedder.model_name if embedder else None
         records: List[IndexRecord] = []
         for i, c in enumerate(chunks):
             records.append(
@@ -113,17 +135,17 @@ class ContextualChunker:
                     chunk_id=c.chunk_id,
                     section_id=c.section_id,
                     doc_id=c.doc_id,
-                    doc_version=document.version,
-                    source_type=document.source_type.value,
+                    doc_version=doc_version,
+                    source_type=source_type,
                     headings_path=tuple(c.headings_path),
                     anchor=c.anchor or Anchor(),
                     bm25_text=self._bm25_text(document, c),
                     chunk_text=c.chunk_text,
-                    contextualized_text_hash=_sha1((c.contextualized_text or "").encode("utf-8")),
+                    contextualized_text_hash=_text_key(c.contextualized_text or ""),
                     keywords=tuple(c.keywords),
                     normalized_citations=tuple(c.normalized_citations),
                     embedding=(embeddings[i] if embeddings else None),
-                    embedding_model=(embedder.model_name if embedder else None),
+                    embedding_model=embedding_model,
                 )
             )
         return records
@@ -230,12 +252,13 @@ class ContextualChunker:
 
     # ----------------------- BM25 text -----------------------
     def _bm25_text(self, document: Document, chunk: Chunk) -> str:
-        parts = [
-            document.title,
-            " > ".join(chunk.headings_path),
-            chunk.chunk_text,
-        ]
-        return "\n".join([p for p in parts if p])
+        # Equivalent to "\n".join of the non-empty parts, without building a
+        # throwaway list per chunk.
+        title = document.title
+        headings = " > ".join(chunk.headings_path)
+        head = f"{title}\n{headings}" if title and headings else (title or headings)
+        text = chunk.chunk_text
+        return f"{head}\n{text}" if head and text else (head or text)
 
 
 # ----------------------- Helpers -------------------------------
@@ -243,49 +266,65 @@ class ContextualChunker:
 
 def _split_by_statute_paragraphs(text: str) -> List[str]:
     # Split on markers like "제1항", "제2호" while keeping them attached
-    pattern = re.compile(r"(?=\s*제\d+(?:항|호))")
-    parts = [p.strip() for p in pattern.split(text) if p.strip()]
+    parts = [s for p in _STATUTE_PARA_RE.split(text) if (s := p.strip())]
     return parts if parts else [text]
 
 
 def _split_by_numbered_paragraphs(text: str) -> List[str]:
     # Common in cases: numbered paras like "1.", "(1)", etc.
-    pattern = re.compile(r"(?=\n\s*(?:\(\d+\)|\d+\.|\d+\)\s))")
-    parts = [p.strip() for p in pattern.split(text) if p.strip()]
+    parts = [s for p in _NUMBERED_PARA_RE.split(text) if (s := p.strip())]
     return parts if parts else _split_by_paragraphs(text)
 
 
 def _split_by_contract_clauses(text: str) -> List[str]:
-    pattern = re.compile(r"(?=\n\s*(?:\d+(?:\.\d+)*\)|\d+(?:\.\d+)*\.|제\d+조))")
-    parts = [p.strip() for p in pattern.split(text) if p.strip()]
+    parts = [s for p in _CONTRACT_CLAUSE_RE.split(text) if (s := p.strip())]
     return parts if parts else _split_by_paragraphs(text)
 
 
 def _split_by_paragraphs(text: str) -> List[str]:
-    parts = [p.strip() for p in re.split(r"\n\s*\n+", text) if p.strip()]
+    parts = [s for p in _PARAGRAPH_BREAK_RE.split(text) if (s := p.strip())]
     return parts if parts else [text]
 
 
 def _pack_spans(spans: Sequence[str], desired: Tuple[int, int], overlap: int) -> List[str]:
+    if len(spans) <= 1:
+        # Most short sections (single-paragraph articles, brief clauses) split
+        # into one span, which is emitted as-is whatever its size; skip the
+        # word counting below.
+        return list(spans)
     lo, hi = desired
     out: List[str] = []
     buf: List[str] = []
+    # Running size of "\n\n".join(buf) (the separator adds 2 chars, no words),
+    # so each candidate is measured in O(1) instead of re-joining the buffer.
+    buf_chars = 0
+    buf_words = 0
     for p in spans:
-        if _approx_tokens("\n\n".join(buf + [p])) <= hi:
+        p_chars = len(p)
+        p_words = len(p.split())
+        chars = buf_chars + (2 if buf else 0) + p_chars
+        words = buf_words + p_words
+        if _token_estimate(chars, words) <= hi:
             buf.append(p)
+            buf_chars, buf_words = chars, words
             continue
         # Flush current buffer: optionally overlap from the end of previous buf
         if buf:
-            out.append("\n\n".join(buf))
+            flushed = "\n\n".join(buf)
+            out.append(flushed)
             # Create overlap by carrying tail of previous buf
             if overlap > 0:
-                tail = _tail_tokens("\n\n".join(buf), overlap)
+                tail = _tail_tokens(flushed, overlap)
                 buf = [tail, p]
+                buf_chars = len(tail) + 2 + p_chars
+                buf_words = len(tail.split()) + p_words
             else:
                 buf = [p]
+                buf_chars, buf_words = p_chars, p_words
         else:
             out.append(p)
             buf = []
+            buf_chars = buf_words = 0
 
     if buf:
         out.append("\n\n".join(buf))
@@ -307,6 +346,28 @@ def _pack_spans(spans: Sequence[str], desired: Tuple[int, int], overlap: int) ->
     return merged
 
 
+def _embed_length_bucketed(
+    embedder: EmbeddingModel, texts: Sequence[str], batch_size: int
+) -> List[List[float]]:
+    """Embed ``texts`` in length-sorted batches and restore the input order.
+
+    Repeated texts (boilerplate clauses, citation-only chunks) are embedded once.
+    """
+
+    unique = list(dict.fromkeys(texts))
+    if batch_size <= 0 or len(unique) <= batch_size:
+        batches = [unique]
+    else:
+        unique.sort(key=len)
+        batches = [unique[i : i + batch_size] for i in range(0, len(unique), batch_size)]
+    by_text: Dict[str, List[float]] = {}
+    for batch in batches:
+        vectors = embedder.embed(batch)
+        assert len(vectors) == len(batch)
+        by_text.update(zip(batch, vectors))
+    return [by_text[t] for t in texts]
+
+
 def _compact_prefix(
     title: str,
     headings: Sequence[str],
@@ -324,10 +385,12 @@ def _compact_prefix(
 
 
 def _approx_tokens(text: str) -> int:
+    return _token_estimate(len(text), len(text.split()))
+
+
+def _token_estimate(chars: int, words: int) -> int:
     # Very rough token proxy: chars/2 for ko-heavy, bounded by words
-    chars = len(text)
-    words = max(1, len(text.split()))
-    return max(words, int(chars / 2))
+    return max(max(1, words), int(chars / 2))
 
 
 def _tail_tokens(text: str, approx_tokens: int) -> str:
@@ -342,12 +405,12 @@ def _tail_tokens(text: str, approx_tokens: int) -> str:
 
 def _sentences(text: str) -> List[str]:
     # naive split by sentence enders in ko/en
-    parts = re.split(r"(?<=[.!?\u3002\uFF0E])\s+|\n+", text.strip())
-    return [p.strip() for p in parts if p.strip()]
+    parts = _SENTENCE_SPLIT_RE.split(text.strip())
+    return [s for p in parts if (s := p.strip())]
 
 
 def _first_label(text: str) -> Optional[str]:
-    m = re.search(r"제\d+조[^\n]*|제\d+항|제\d+호|\b주문\b|\b이유\b", text)
+    m = _FIRST_LABEL_RE.search(text)
     return m.group(0) if m else None
 
 
@@ -355,9 +418,9 @@ def _keywords_guess(document: Document, section: Section, chunk: Chunk) -> List[
     # Extract simple tokens likely to be legal terms or IDs
     kws: List[str] = []
     # statute/article markers
-    kws.extend(re.findall(r"민법|형법|상법|행정|지재|제\d+조", chunk.chunk_text))
+    kws.extend(_KEYWORD_TERM_RE.findall(chunk.chunk_text))
     # numerics and docket-like
-    kws.extend(re.findall(r"\b\d{2,}[가-힣]?\b", chunk.chunk_text))
+    kws.extend(_KEYWORD_NUMBER_RE.findall(chunk.chunk_text))
     # headings words
     if section.title:
         kws.extend(section.title.split())
@@ -367,12 +430,12 @@ def _keywords_guess(document: Document, section: Section, chunk: Chunk) -> List[
 def _citations_guess(document: Document, section: Section, chunk: Chunk) -> List[str]:
     cites: List[str] = []
     # statute article pattern
-    for m in re.findall(r"(?:민법|형법|상법|민사소송법)?\s*제\s*\d+\s*조", chunk.chunk_text):
-        cites.append(re.sub(r"\s+", "", m))
+    for m in _STATUTE_CITE_RE.findall(chunk.chunk_text):
+        cites.append(_WHITESPACE_RE.sub("", m))
     # case IDs like 2009다12345
-    cites.extend(re.findall(r"\b\d{4}[가-힣]{1}\d{3,6}\b", chunk.chunk_text))
+    cites.extend(_CASE_ID_RE.findall(chunk.chunk_text))
     return list(dict.fromkeys(cites))[:12]
 
 
-def _sha1(b: bytes) -> str:
-    return hashlib.sha1(b).hexdigest()
+def _text_key(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
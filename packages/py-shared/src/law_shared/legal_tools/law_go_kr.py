@@ -31,7 +31,7 @@ INTERPRETATION_TITLE_KEYS: frozenset[str] = frozenset({"안건명", "title"})
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LawSearchResult:
     law_id: str
     title: str
@@ -61,7 +61,7 @@ class LawSearchError(RuntimeError):
     """Raised when the law.go.kr search API returns an error."""
 
 
-@dataclass
+@dataclass(slots=True)
 class LawInterpretationResult:
     serial_no: Optional[str]
     title: Optional[str]
@@ -97,7 +97,7 @@ class LawInterpretationDetail:
     raw: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class LawDetailParagraph:
     number: Optional[str]
     text: Optional[str]
@@ -106,7 +106,7 @@ class LawDetailParagraph:
     raw: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class LawDetailArticle:
     article_no: Optional[str]
     title: Optional[str]
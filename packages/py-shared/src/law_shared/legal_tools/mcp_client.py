@@ -5,6 +5,7 @@ import json
 import shutil
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -59,7 +60,9 @@ def mcp_session(server: MCPServer):
             pass
 
 
+@lru_cache(maxsize=None)
 def _find_command(cmd: str) -> Optional[str]:
+    # Binaries on PATH do not change within a process; resolve each once.
     return shutil.which(cmd)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
@@ -22,6 +23,7 @@ from mcp.server.session import ServerSession
 from law_shared.legal_tools.agent_graph import (
     Hit,
     USE_CASES_MD,
+    preload_local_corpus,
     tool_keyword_search,
     tool_law_go_detail,
     tool_law_go_interpretation_detail,
@@ -52,12 +54,27 @@ def _resolve_data_dir() -> Path:
 async def _lifespan(_: FastMCP) -> AsyncIterator[LifespanContext]:
     data_dir = _resolve_data_dir()
     logger.info("law_mcp_startup", data_dir=str(data_dir))
+    # Warm the local keyword corpus off the event loop so the server starts
+    # accepting sessions immediately; the first search reuses the result.
+    preload = asyncio.create_task(asyncio.to_thread(preload_local_corpus, data_dir))
+    preload.add_done_callback(_log_preload_result)
     try:
         yield LifespanContext(data_dir=data_dir)
     finally:
+        preload.cancel()
         logger.info("law_mcp_shutdown")
 
 
+def _log_preload_result(task: "asyncio.Task[int]") -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("law_mcp_preload_failed", error=str(exc))
+    else:
+        logger.info("law_mcp_preload_done", documents=task.result())
+
+
 mcp = FastMCP("LawTools", lifespan=_lifespan)
 
 
@@ -79,8 +96,12 @@ def _hits_payload(hits: List[Hit]) -> Dict[str, Any]:
     return {"hits": [_serialize_hit(hit) for hit in hits], "count": len(hits)}
 
 
+# FastMCP calls synchronous tools directly on the event loop, so a slow
+# OpenSearch or law.go.kr round trip would stall every other session. The
+# tools are async and push the blocking lookups onto worker threads instead.
+
 @mcp.tool()
-def keyword_search(
+async def keyword_search(
     ctx: Context[ServerSession, LifespanContext],
     *,
     query: str,
@@ -89,7 +110,8 @@ def keyword_search(
 ) -> Dict[str, Any]:
     """OpenSearch 기반 키워드 검색 결과를 반환합니다."""
 
-    hits = tool_keyword_search(
+    hits = await asyncio.to_thread(
+        tool_keyword_search,
         query=query,
         k=k,
         context_chars=context_chars,
@@ -99,7 +121,7 @@ def keyword_search(
 
 
 @mcp.tool()
-def law_statute_search(
+async def law_statute_search(
     ctx: Context[ServerSession, LifespanContext],
     *,
     query: str,
@@ -120,7 +142,8 @@ def law_statute_search(
 ) -> Dict[str, Any]:
     """law.go.kr 법령 검색 API를 호출합니다."""
 
-    response, hits = tool_law_go_search(
+    response, hits = await asyncio.to_thread(
+        tool_law_go_search,
         query=query,
         search=search,
         display=display,
@@ -143,7 +166,7 @@ def law_statute_search(
 
 
 @mcp.tool()
-def law_statute_detail(
+async def law_statute_detail(
     ctx: Context[ServerSession, LifespanContext],
     *,
     law_id: Optional[str] = None,
@@ -157,7 +180,8 @@ def law_statute_detail(
 ) -> Dict[str, Any]:
     """법령 본문을 law.go.kr API로 조회합니다."""
 
-    detail, hits = tool_law_go_detail(
+    detail, hits = await asyncio.to_thread(
+        tool_law_go_detail,
         law_id=law_id,
         mst=mst,
         lm=lm,
@@ -173,7 +197,7 @@ def law_statute_detail(
 
 
 @mcp.tool()
-def law_interpretation_search(
+async def law_interpretation_search(
     ctx: Context[ServerSession, LifespanContext],
     *,
     query: Optional[str] = None,
@@ -191,7 +215,8 @@ def law_interpretation_search(
 ) -> Dict[str, Any]:
     """법령해석례 검색 API를 호출합니다."""
 
-    response, hits = tool_law_go_interpretations(
+    response, hits = await asyncio.to_thread(
+        tool_law_go_interpretations,
         query=query,
         search=search,
         display=display,
@@ -211,7 +236,7 @@ def law_interpretation_search(
 
 
 @mcp.tool()
-def law_interpretation_detail(
+async def law_interpretation_detail(
     ctx: Context[ServerSession, LifespanContext],
     *,
     interpretation_id: Optional[str] = None,
@@ -220,7 +245,8 @@ def law_interpretation_detail(
 ) -> Dict[str, Any]:
     """법령해석례 본문을 law.go.kr API로 조회합니다."""
 
-    detail, hits = tool_law_go_interpretation_detail(
+    detail, hits = await asyncio.to_thread(
+        tool_law_go_interpretation_detail,
         interpretation_id=interpretation_id,
         lm=lm,
         oc=oc,
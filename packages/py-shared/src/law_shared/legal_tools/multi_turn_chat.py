@@ -296,19 +296,20 @@ class PostgresChatManager:
     def get_history(self, thread_id: str) -> List[Dict[str, Any]]:
         """Return the checkpoint history for a thread (latest first)."""
 
+        return list(self.iter_history(thread_id))
+
+    def iter_history(self, thread_id: str) -> Iterator[Dict[str, Any]]:
+        """Yield checkpoint history entries one at a time (latest first)."""
+
         cfg = {"configurable": {"thread_id": self._normalize_thread_id(thread_id)}}
-        history = []
         for snap in self._ensure_graph().get_state_history(cfg):
             messages = [
                 self._message_to_dict(m) for m in snap.values.get("messages", [])
             ]
-            history.append(
-                {
-                    "checkpoint_id": self._extract_checkpoint_id(snap),
-                    "messages": messages,
-                }
-            )
-        return history
+            yield {
+                "checkpoint_id": self._extract_checkpoint_id(snap),
+                "messages": messages,
+            }
 
     def new_thread_id(self, *, prefix: str = "thread") -> str:
         """Generate a unique thread identifier."""
@@ -512,15 +513,13 @@ class PostgresChatManager:
         if isinstance(content, list):
             parts: List[str] = []
             for item in content:
-                if isinstance(item, dict) and "text" in item:
-                    parts.append(str(item["text"]))
-                elif (
-                    isinstance(item, dict)
-                    and "text" not in item
-                    and item.get("type") == "text"
-                ):
-                    parts.append(str(item.get("text", "")))
-                else:
-                    parts.append(str(item))
+                if isinstance(item, dict):
+                    if "text" in item:
+                        parts.append(str(item["text"]))
+                        continue
+                    if item.get("type") == "text":
+                        # Text block without a payload contributes nothing.
+                        continue
+                parts.append(str(item))
             return "".join(parts)
         return str(content)
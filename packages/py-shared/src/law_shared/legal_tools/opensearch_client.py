@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
 import base64
 import json
 import os
+import threading
+from functools import lru_cache
 from typing import Dict, Iterable, Optional, Tuple
 from urllib import error, request
 from urllib.parse import urlsplit, urlunsplit
 
+try:  # Pooled keep-alive client; urllib (one connection per call) is the fallback
+    import httpx
+except ImportError:  # pragma: no cover - httpx is optional
+    httpx = None  # type: ignore[assignment]
+
 DEFAULT_URL_ENV: tuple[str, ...] = (
     "LAW_OPENSEARCH_URL",
     "OPENSEARCH_URL",
@@ -40,6 +48,9 @@ DEFAULT_INDEX_ENV: tuple[str, ...] = (
     "MEILI_INDEX_UID",
 )
 
+_CLIENT: Optional["httpx.Client"] = None
+_CLIENT_LOCK = threading.Lock()
+
 
 def first_env(keys: Iterable[str]) -> Optional[str]:
     """Return the first defined environment variable in ``keys``."""
@@ -91,6 +102,14 @@ def redact_url_credentials(url: str) -> str:
     return urlunsplit((parsed.scheme, netloc, parsed.path, parsed.query, parsed.fragment))
 
 
+@lru_cache(maxsize=8)
+def _basic_authorization(username: str, password: str) -> str:
+    # Credentials are still read per request (so rotation applies), but the
+    # header is only base64-encoded once per credential pair.
+    token = base64.b64encode(f"{username}:{password}".encode("utf-8"))
+    return f"Basic {token.decode('ascii')}"
+
+
 def _headers(content_type: str) -> Dict[str, str]:
     headers = {"Content-Type": content_type, "Accept": "application/json"}
     if key := api_key():
@@ -98,27 +117,49 @@ def _headers(content_type: str) -> Dict[str, str]:
     else:
         username, password = basic_auth()
         if username and password:
-            token = base64.b64encode(f"{username}:{password}".encode("utf-8"))
-            headers["Authorization"] = f"Basic {token.decode('ascii')}"
+            headers["Authorization"] = _basic_authorization(username, password)
     return headers
 
 
-def request_json(
-    method: str,
-    path: str,
-    payload: Optional[Dict] = None,
-    *,
-    timeout: float = 10.0,
-) -> Dict:
-    """Perform an HTTP request against OpenSearch and parse the JSON response."""
+def _client() -> "httpx.Client":
+    """Return the process-wide pooled HTTP client (created on first use)."""
+
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=5, max_connections=10)
+                )
+                atexit.register(_CLIENT.close)
+    return _CLIENT
 
+
+def _send(
+    method: str, path: str, data: Optional[bytes], content_type: str, timeout: float
+) -> bytes:
     url = f"{base_url().rstrip('/')}{path}"
-    data = json.dumps(payload).encode("utf-8") if payload is not None else None
-    req = request.Request(url, data=data, method=method, headers=_headers("application/json"))
+    headers = _headers(content_type)
+    if httpx is not None:
+        try:
+            resp = _client().request(
+                method, url, content=data, headers=headers, timeout=timeout
+            )
+        except httpx.HTTPError as exc:  # pragma: no cover - network failure
+            raise RuntimeError(
+                f"Failed to reach OpenSearch at {redact_url_credentials(url)}: {exc}"
+            ) from exc
+        if resp.status_code >= 400:
+            raise RuntimeError(
+                f"OpenSearch {method} {path} failed: {resp.status_code} {resp.text}"
+            )
+        # Raw bytes: json.loads decodes UTF-8 itself, so skip the str copy.
+        return resp.content
+
+    req = request.Request(url, data=data, method=method, headers=headers)
     try:
         with request.urlopen(req, timeout=timeout) as resp:
-            text = resp.read().decode("utf-8")
-            return json.loads(text) if text else {}
+            return resp.read()
     except error.HTTPError as exc:  # pragma: no cover - network failure
         body = exc.read().decode("utf-8", "ignore")
         status = getattr(exc, "code", None) or getattr(exc, "status", "")
@@ -131,6 +172,20 @@ def request_json(
         ) from exc
 
 
+def request_json(
+    method: str,
+    path: str,
+    payload: Optional[Dict] = None,
+    *,
+    timeout: float = 10.0,
+) -> Dict:
+    """Perform an HTTP request against OpenSearch and parse the JSON response."""
+
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    body = _send(method, path, data, "application/json", timeout)
+    return json.loads(body) if body else {}
+
+
 def request_ndjson(
     method: str,
     path: str,
@@ -140,25 +195,8 @@ def request_ndjson(
 ) -> Dict:
     """Perform an NDJSON request against OpenSearch and parse the JSON response."""
 
-    url = f"{base_url().rstrip('/')}{path}"
-    data = payload.encode("utf-8")
-    req = request.Request(
-        url, data=data, method=method, headers=_headers("application/x-ndjson")
-    )
-    try:
-        with request.urlopen(req, timeout=timeout) as resp:
-            text = resp.read().decode("utf-8")
-            return json.loads(text) if text else {}
-    except error.HTTPError as exc:  # pragma: no cover - network failure
-        body = exc.read().decode("utf-8", "ignore")
-        status = getattr(exc, "code", None) or getattr(exc, "status", "")
-        raise RuntimeError(
-            f"OpenSearch {method} {path} failed: {status} {body}"
-        ) from exc
-    except error.URLError as exc:  # pragma: no cover - network failure
-        raise RuntimeError(
-            f"Failed to reach OpenSearch at {redact_url_credentials(url)}: {exc.reason}"
-        ) from exc
+    body = _send(method, path, payload.encode("utf-8"), "application/x-ndjson", timeout)
+    return json.loads(body) if body else {}
 
 
 __all__ = [
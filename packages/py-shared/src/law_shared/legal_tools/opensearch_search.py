@@ -1,14 +1,63 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from law_shared.legal_tools.opensearch_client import request_json, resolve_index_name
+from law_shared.legal_tools.opensearch_client import (
+    base_url,
+    request_json,
+    resolve_index_name,
+)
 
 MAX_OPENSEARCH_LIMIT = 100
-
-
-@dataclass
+SEARCH_CACHE_SIZE_ENV = "LAW_OPENSEARCH_CACHE_SIZE"
+DEFAULT_SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL_ENV = "LAW_OPENSEARCH_CACHE_TTL"
+DEFAULT_SEARCH_CACHE_TTL = 300.0
+
+_CacheKey = Tuple[str, str, str, int, int]
+# key -> (monotonic expiry, results). Re-indexing usually happens in another
+# process, so the TTL is what bounds how long a server can serve stale hits.
+_SEARCH_CACHE: "OrderedDict[_CacheKey, Tuple[float, Tuple[OpenSearchDoc, ...]]]" = (
+    OrderedDict()
+)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Static parts of the search request body, built once and shared by every
+# query; only the query text and paging vary per call. Never mutated.
+_MATCH_FIELDS = [
+    "title^3",
+    "body",
+    "response_institute",
+    "response_date",
+    "task_type",
+]
+_SOURCE_FIELDS = [
+    "id",
+    "doc_id",
+    "title",
+    "body",
+    "source_path",
+    "response_institute",
+    "response_date",
+    "task_type",
+]
+_HIGHLIGHT = {
+    "pre_tags": ["<em>"],
+    "post_tags": ["</em>"],
+    "fields": {
+        "body": {"fragment_size": 200, "number_of_fragments": 1},
+        "title": {"fragment_size": 160, "number_of_fragments": 1},
+    },
+}
+
+
+@dataclass(slots=True)
 class OpenSearchDoc:
     """Search result payload returned by OpenSearch."""
 
@@ -32,6 +81,47 @@ def _build_highlight_snippet(hit: dict) -> str:
     return ""
 
 
+def normalize_query(query: str) -> str:
+    """Return *query* with NFKC applied and whitespace runs collapsed.
+
+    Variants that differ only in spacing or full-width characters tokenize
+    identically, so the normalized form is both sent to OpenSearch and used as
+    the cache key.
+    """
+
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+def _search_cache_size() -> int:
+    raw = os.getenv(SEARCH_CACHE_SIZE_ENV)
+    if raw is None:
+        return DEFAULT_SEARCH_CACHE_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        return DEFAULT_SEARCH_CACHE_SIZE
+
+
+def _search_cache_ttl() -> float:
+    raw = os.getenv(SEARCH_CACHE_TTL_ENV)
+    if raw is None:
+        return DEFAULT_SEARCH_CACHE_TTL
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_SEARCH_CACHE_TTL
+
+
+def clear_search_cache() -> None:
+    """Drop this process's cached OpenSearch results.
+
+    Other processes are unaffected and rely on the cache TTL instead.
+    """
+
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
 def search_opensearch(
     query: str,
     *,
@@ -41,45 +131,44 @@ def search_opensearch(
 ) -> List[OpenSearchDoc]:
     """Execute a keyword search against OpenSearch."""
 
-    if not query.strip():
+    query = normalize_query(query)
+    if not query:
         return []
 
     index_name = resolve_index_name(index)
     safe_limit = min(max(0, limit), MAX_OPENSEARCH_LIMIT)
+    cache_size = _search_cache_size()
+    cache_ttl = _search_cache_ttl()
+    if not cache_ttl:
+        cache_size = 0
+    cache_key: _CacheKey = (
+        base_url(),
+        index_name,
+        query,
+        safe_limit,
+        max(0, offset),
+    )
+    if cache_size:
+        with _SEARCH_CACHE_LOCK:
+            cached = _SEARCH_CACHE.get(cache_key)
+            if cached is not None:
+                expires_at, docs = cached
+                if time.monotonic() < expires_at:
+                    _SEARCH_CACHE.move_to_end(cache_key)
+                    return list(docs)
+                del _SEARCH_CACHE[cache_key]
     payload = {
         "query": {
             "multi_match": {
                 "query": query,
-                "fields": [
-                    "title^3",
-                    "body",
-                    "response_institute",
-                    "response_date",
-                    "task_type",
-                ],
+                "fields": _MATCH_FIELDS,
                 "type": "best_fields",
             }
         },
         "from": max(0, offset),
         "size": safe_limit,
-        "_source": [
-            "id",
-            "doc_id",
-            "title",
-            "body",
-            "source_path",
-            "response_institute",
-            "response_date",
-            "task_type",
-        ],
-        "highlight": {
-            "pre_tags": ["<em>"],
-            "post_tags": ["</em>"],
-            "fields": {
-                "body": {"fragment_size": 200, "number_of_fragments": 1},
-                "title": {"fragment_size": 160, "number_of_fragments": 1},
-            },
-        },
+        "_source": _SOURCE_FIELDS,
+        "highlight": _HIGHLIGHT,
     }
     try:
         data = request_json("POST", f"/{index_name}/_search", payload)
@@ -93,23 +182,39 @@ def search_opensearch(
         if not isinstance(item, dict):
             continue
         source = item.get("_source") or {}
-        snippet = _build_highlight_snippet(item) or (source.get("body") or source.get("title") or "")
+        # Each source field is looked up once and reused for the fallbacks.
+        source_id = source.get("id")
+        source_doc_id = source.get("doc_id")
+        title = source.get("title")
+        body = source.get("body")
+        snippet = _build_highlight_snippet(item) or (body or title or "")
 
         score = 0.0
         if isinstance(raw_score := item.get("_score"), (int, float)):
             score = float(raw_score)
         out.append(
             OpenSearchDoc(
-                id=str(item.get("_id") or source.get("id") or source.get("doc_id") or ""),
-                doc_id=str(source.get("doc_id") or source.get("id") or ""),
-                title=str(source.get("title") or ""),
-                body=str(source.get("body") or ""),
+                id=str(item.get("_id") or source_id or source_doc_id or ""),
+                doc_id=str(source_doc_id or source_id or ""),
+                title=str(title or ""),
+                body=str(body or ""),
                 snippet=str(snippet or ""),
                 score=score,
                 source_path=str(source.get("source_path") or ""),
             )
         )
+    if cache_size:
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[cache_key] = (time.monotonic() + cache_ttl, tuple(out))
+            _SEARCH_CACHE.move_to_end(cache_key)
+            while len(_SEARCH_CACHE) > cache_size:
+                _SEARCH_CACHE.popitem(last=False)
     return out
 
 
-__all__ = ["OpenSearchDoc", "search_opensearch"]
+__all__ = [
+    "OpenSearchDoc",
+    "clear_search_cache",
+    "normalize_query",
+    "search_opensearch",
+]
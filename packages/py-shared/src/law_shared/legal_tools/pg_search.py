@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 
 def ensure_psycopg():
@@ -15,7 +15,7 @@ def ensure_psycopg():
         ) from e
 
 
-@dataclass
+@dataclass(slots=True)
 class PgDoc:
     id: str
     doc_id: str
@@ -26,12 +26,59 @@ class PgDoc:
     score: float
 
 
-def _has_extension(conn, name: str) -> bool:
+# (dsn, extension) -> installed. The catalog rarely changes, so each search
+# skips the extra round trip once the answer is known.
+_EXTENSION_CACHE: Dict[Tuple[str, str], bool] = {}
+
+
+def _has_extension(conn, name: str, *, dsn: Optional[str] = None) -> bool:
+    key = (dsn, name) if dsn else None
+    if key is not None and key in _EXTENSION_CACHE:
+        return _EXTENSION_CACHE[key]
     try:
         row = conn.execute("SELECT 1 FROM pg_extension WHERE extname = %s", (name,)).fetchone()
-        return bool(row)
     except Exception:
+        # Don't pin a transient failure; retry on the next search.
         return False
+    if key is not None:
+        _EXTENSION_CACHE[key] = bool(row)
+    return bool(row)
+
+
+# Query text is static; built once at import instead of per search.
+_PARADEDB_SEARCH_SQL = """
+    SELECT id::text,
+           COALESCE(doc_id, ''),
+           COALESCE(title, ''),
+           COALESCE(path, ''),
+           COALESCE(body, ''),
+           paradedb.snippet(body) AS snippet,
+           paradedb.score(id) AS score
+    FROM public.legal_docs
+    WHERE title @@@ %(q)s OR body @@@ %(q)s
+    ORDER BY score DESC
+    LIMIT %(k)s OFFSET %(o)s
+"""
+
+_FTS_SEARCH_SQL = """
+    WITH cfg AS (
+      SELECT 'simple'::regconfig AS cf
+    )
+    SELECT id::text,
+           COALESCE(doc_id, ''),
+           COALESCE(title, ''),
+           COALESCE(path, ''),
+           COALESCE(body, ''),
+           ts_headline(cfg.cf, body, plainto_tsquery(cfg.cf, %(q)s)) AS snippet,
+           ts_rank_cd(
+               to_tsvector(cfg.cf, COALESCE(title,'') || ' ' || body),
+               plainto_tsquery(cfg.cf, %(q)s)
+           ) AS score
+    FROM public.legal_docs, cfg
+    WHERE to_tsvector(cfg.cf, COALESCE(title,'') || ' ' || body) @@ plainto_tsquery(cfg.cf, %(q)s)
+    ORDER BY score DESC
+    LIMIT %(k)s OFFSET %(o)s
+"""
 
 
 def search_bm25(query: str, limit: int = 10, offset: int = 0) -> List[PgDoc]:
@@ -41,60 +88,24 @@ def search_bm25(query: str, limit: int = 10, offset: int = 0) -> List[PgDoc]:
     if not query.strip():
         return []
 
+    params = {"q": query, "k": int(limit), "o": int(max(0, offset))}
     psycopg = ensure_psycopg()
     with psycopg.connect(dsn) as conn:
-        if _has_extension(conn, "pg_search"):
-            sql = (
-                """
-                SELECT id::text,
-                       COALESCE(doc_id, ''),
-                       COALESCE(title, ''),
-                       COALESCE(path, ''),
-                       COALESCE(body, ''),
-                       paradedb.snippet(body) AS snippet,
-                       paradedb.score(id) AS score
-                FROM public.legal_docs
-                WHERE title @@@ %(q)s OR body @@@ %(q)s
-                ORDER BY score DESC
-                LIMIT %(k)s OFFSET %(o)s
-                """
-            )
-            rows = conn.execute(sql, {"q": query, "k": int(limit), "o": int(max(0, offset))}).fetchall()
+        if _has_extension(conn, "pg_search", dsn=dsn):
+            rows = conn.execute(_PARADEDB_SEARCH_SQL, params).fetchall()
         else:
             # Fallback to PostgreSQL FTS (tsvector + ts_rank)
-            sql = (
-                """
-                WITH cfg AS (
-                  SELECT 'simple'::regconfig AS cf
-                )
-                SELECT id::text,
-                       COALESCE(doc_id, ''),
-                       COALESCE(title, ''),
-                       COALESCE(path, ''),
-                       COALESCE(body, ''),
-                       ts_headline(cfg.cf, body, plainto_tsquery(cfg.cf, %(q)s)) AS snippet,
-                       ts_rank_cd(
-                           to_tsvector(cfg.cf, COALESCE(title,'') || ' ' || body),
-                           plainto_tsquery(cfg.cf, %(q)s)
-                       ) AS score
-                FROM public.legal_docs, cfg
-                WHERE to_tsvector(cfg.cf, COALESCE(title,'') || ' ' || body) @@ plainto_tsquery(cfg.cf, %(q)s)
-                ORDER BY score DESC
-                LIMIT %(k)s OFFSET %(o)s
-                """
-            )
-            rows = conn.execute(sql, {"q": query, "k": int(limit), "o": int(max(0, offset))}).fetchall()
-    out: List[PgDoc] = []
-    for r in rows:
-        out.append(
-            PgDoc(
-                id=r[0],
-                doc_id=r[1],
-                title=r[2],
-                path=r[3],
-                body=r[4] or "",
-                snippet=r[5] or "",
-                score=float(r[6] or 0.0),
-            )
+            rows = conn.execute(_FTS_SEARCH_SQL, params).fetchall()
+    # Rows are positional tuples in SELECT order; unpack instead of indexing.
+    return [
+        PgDoc(
+            id=row_id,
+            doc_id=doc_id,
+            title=title,
+            path=path,
+            body=body or "",
+            snippet=snippet or "",
+            score=float(score or 0.0),
         )
-    return out
+        for row_id, doc_id, title, path, body, snippet, score in rows
+    ]
@@ -21,6 +21,16 @@ _STRIP_PREFIX_RE = re.compile(r"^(?:[-*]|\d+[.)]|#{1,6})\s*")
 _CASE_HINT_RE = re.compile(r"\d{2,4}[가-힣]\d+")
 _STATUTE_HINT_RE = re.compile(r"법|시행령|시행규칙|조례|규칙")
 _HEADING_LINE_RE = re.compile(r"^(?:#{1,6}\s*|\d+[.)]\s*)")
+# "다." already ends in "." so a single fixed-width look-behind covers it
+# (a variable-width alternation is rejected by the re module).
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_SENTENCE_END_RE = re.compile(r"[.!?]|다\.$")
+_EMPHASIS_RE = re.compile(r"[*_`]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_STATUTE_ARTICLE_RE = re.compile(r"[가-힣A-Za-z·ㆍ\s]+제\s*\d+\s*조")
+_JSON_SUFFIX_RE = re.compile(r"\.json$")
+_SLUG_INVALID_RE = re.compile(r"[^0-9a-z가-힣]+")
+_DASH_RUN_RE = re.compile(r"-+")
 _LAW_GO_KR_ID_RE = re.compile(
     r"^(?P<system>[a-z_]+):(?P<kind>[a-z_]+):(?P<source_id>[^:]+)(?::(?P<version>.+))?$"
 )
@@ -114,8 +124,10 @@ def _build_evidence(
             source=str(citation.get("source") or ""),
             snippet=str(citation.get("snippet") or ""),
         )
+        # Every field is already coerced above from our own retrieval output,
+        # so skip re-validating each evidence row.
         items.append(
-            VerificationEvidence(
+            VerificationEvidence.model_construct(
                 id=f"evidence-{rank}",
                 type=source_type,
                 title=str(citation.get("title") or "출처 미상"),
@@ -275,19 +287,19 @@ def _extract_claim_lines(answer: str) -> List[str]:
         cleaned.append(_normalize_claim_text(line))
     if cleaned:
         return cleaned[:5]
-    sentences = [segment.strip() for segment in re.split(r"(?<=[.!?]|다\.)\s+", answer)]
+    sentences = [segment.strip() for segment in _SENTENCE_SPLIT_RE.split(answer)]
     return [_normalize_claim_text(sentence) for sentence in sentences if sentence][:5]
 
 
 def _looks_like_heading(line: str, *, raw_heading: bool) -> bool:
     if _CLAIM_REF_RE.search(line):
         return False
-    compact = re.sub(r"[*_`]+", "", line).strip()
+    compact = _EMPHASIS_RE.sub("", line).strip()
     if raw_heading and len(compact) <= 80:
         return True
     if len(compact) > 60:
         return False
-    if re.search(r"[.!?]|다\.$", compact):
+    if _SENTENCE_END_RE.search(compact):
         return False
     heading_keywords = (
         "요약",
@@ -304,7 +316,7 @@ def _looks_like_heading(line: str, *, raw_heading: bool) -> bool:
 
 def _normalize_claim_text(line: str) -> str:
     line = line.replace("**", "").replace("__", "")
-    return re.sub(r"\s+", " ", line).strip()
+    return _WHITESPACE_RE.sub(" ", line).strip()
 
 
 def _determine_answer_state(
@@ -439,8 +451,8 @@ def _classify_source_type(*, title: str, doc_id: str, source: str) -> str:
 
 def _extract_citation_tokens(text: str) -> List[str]:
     tokens: List[str] = []
-    for match in re.findall(r"[가-힣A-Za-z·ㆍ\s]+제\s*\d+\s*조", text):
-        compact = re.sub(r"\s+", "", match)
+    for match in _STATUTE_ARTICLE_RE.findall(text):
+        compact = _WHITESPACE_RE.sub("", match)
         if compact:
             tokens.append(compact)
     for case_no in _CASE_HINT_RE.findall(text):
@@ -450,9 +462,9 @@ def _extract_citation_tokens(text: str) -> List[str]:
 
 def _normalize_title_token(value: str) -> str:
     lowered = value.strip().lower()
-    lowered = re.sub(r"\.json$", "", lowered)
-    lowered = re.sub(r"[^0-9a-z가-힣]+", "-", lowered)
-    lowered = re.sub(r"-+", "-", lowered).strip("-")
+    lowered = _JSON_SUFFIX_RE.sub("", lowered)
+    lowered = _SLUG_INVALID_RE.sub("-", lowered)
+    lowered = _DASH_RUN_RE.sub("-", lowered).strip("-")
     return lowered
 
 
@@ -38,6 +38,10 @@ def create_app(settings: ShareSettings | None = None) -> FastAPI:
     def get_service(session: Session = Depends(get_session)) -> ShareService:
         return ShareService(session=session, settings=settings)
 
+    # Compared as bytes: the key is encoded once, and non-ASCII header values
+    # are rejected instead of making compare_digest raise TypeError.
+    management_key = (settings.management_api_key or "").encode("utf-8")
+
     def get_current_actor(
         authorization: Optional[str] = Header(default=None),
         actor_id: Optional[str] = Header(default=None, alias="X-Actor-ID"),
@@ -48,7 +52,7 @@ def create_app(settings: ShareSettings | None = None) -> FastAPI:
             )
         scheme, _, token = (authorization or "").partition(" ")
         if scheme.lower() != "bearer" or not hmac.compare_digest(
-            token, settings.management_api_key
+            token.encode("utf-8", "surrogatepass"), management_key
         ):
             raise HTTPException(status_code=401, detail="Authentication required")
         if not actor_id:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from pydantic import BaseModel
 
@@ -15,6 +15,8 @@ __all__ = [
     "RedactionEngine",
 ]
 
+_BACKREFERENCE_RE = re.compile(r"\\\d|\(\?P=")
+
 
 @dataclass(slots=True, frozen=True)
 class RedactionRule:
@@ -51,26 +53,79 @@ class RedactionEngine:
         if rules is None:
             rules = self._default_rules()
         self.rules: List[RedactionRule] = list(rules)
+        self._combined_key: Tuple[RedactionRule, ...] = ()
+        self._combined: re.Pattern[str] | None = None
 
     def preview(self, payloads: Mapping[str, str]) -> RedactionPreview:
         """Return redacted payloads without mutating input."""
 
-        redacted: MutableMapping[str, str] = dict(payloads)
+        any_rule = self._any_rule()
+        redacted: Dict[str, str] = {}
         matches: List[RedactionMatch] = []
         for field, value in payloads.items():
+            if any_rule is not None and any_rule.search(value) is None:
+                # Most payload fields contain nothing sensitive; one scan with
+                # the combined pattern skips running each rule separately.
+                redacted[field] = value
+                continue
             updated_value, field_matches = self._apply_rules(field, value)
             redacted[field] = updated_value
             matches.extend(field_matches)
-        return RedactionPreview(redacted=dict(redacted), matches=matches)
+        return RedactionPreview(redacted=redacted, matches=matches)
 
     # ---------------------------- internals ----------------------------
+    def _any_rule(self) -> re.Pattern[str] | None:
+        # ``rules`` is a public list, so rebuild whenever it has changed.
+        key = tuple(self.rules)
+        if key != self._combined_key:
+            self._combined_key = key
+            self._combined = self._combine_rules(key)
+        return self._combined
+
+    @staticmethod
+    def _combine_rules(rules: Sequence[RedactionRule]) -> re.Pattern[str] | None:
+        """Join all rule patterns into one alternation for a cheap pre-check.
+
+        Returns ``None`` when the rules cannot be merged safely (mixed flags,
+        backreferences whose group numbers would shift, or conflicting group
+        names), in which case every rule is applied.
+        """
+
+        if not rules:
+            return None
+        flags = rules[0].pattern.flags
+        if any(
+            rule.pattern.flags != flags or _BACKREFERENCE_RE.search(rule.pattern.pattern)
+            for rule in rules
+        ):
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{rule.pattern.pattern})" for rule in rules), flags
+            )
+        except re.error:
+            return None
+
     def _apply_rules(self, field: str, text: str) -> tuple[str, List[RedactionMatch]]:
         updated = text
         matches: List[RedactionMatch] = []
         for rule in self.rules:
-            rule_matches = list(rule.pattern.finditer(text))
-            if rule_matches:
-                updated = rule.pattern.sub(rule.replacement, updated)
+            if updated is text:
+                # Nothing replaced yet: collect matches during the substitution
+                # itself instead of scanning the text a second time.
+                rule_matches: List[re.Match[str]] = []
+
+                def _replace(match: re.Match[str], rule: RedactionRule = rule) -> str:
+                    rule_matches.append(match)
+                    return match.expand(rule.replacement)
+
+                replaced = rule.pattern.sub(_replace, text)
+                if rule_matches:
+                    updated = replaced
+            else:
+                rule_matches = list(rule.pattern.finditer(text))
+                if rule_matches:
+                    updated = rule.pattern.sub(rule.replacement, updated)
             for match in rule_matches:
                 replacement = rule.replacement
                 matches.append(
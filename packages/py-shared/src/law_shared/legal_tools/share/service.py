@@ -93,7 +93,16 @@ def init_engine(settings: ShareSettings) -> Engine:
             raise ValueError(
                 f"Only PostgreSQL is supported. Invalid database URL scheme: {database_url.split('://')[0]}"
             )
-        engine = create_engine(database_url, pool_pre_ping=True, future=True)
+        # Shared links are served concurrently; size the pool like the
+        # workspace service and recycle before server-side idle timeouts.
+        engine = create_engine(
+            database_url,
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20,
+            pool_recycle=1800,
+            future=True,
+        )
     Base.metadata.create_all(engine)
     return engine
 
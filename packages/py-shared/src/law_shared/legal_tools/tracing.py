@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from contextlib import contextmanager
+from functools import lru_cache
 from threading import Lock
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
@@ -16,22 +17,16 @@ _ENABLED_VALUES = {"1", "true", "on", "yes", "enable", "enabled"}
 
 _callbacks: Optional[List[Any]] = None
 _configured = False
-_trace_loaded = False
-_trace_func: Optional[Any] = None
 _configure_lock = Lock()
 
 
+@lru_cache(maxsize=1)
 def _load_trace_func() -> Optional[Any]:
-    global _trace_loaded, _trace_func
-    if _trace_loaded:
-        return _trace_func
     try:
         from langsmith.run_helpers import trace as trace_func  # type: ignore import
     except Exception:
-        trace_func = None
-    _trace_func = trace_func
-    _trace_loaded = True
-    return _trace_func
+        return None
+    return trace_func
 
 
 @contextmanager
@@ -94,7 +94,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 생성."""
         try:
             project = service.create_project(request, user_id)
-            return schemas.ProjectResponse.from_orm(project)
+            return schemas.ProjectResponse.model_validate(project)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e)) from None
 
@@ -107,7 +107,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 조회."""
         try:
             project = service.get_project(project_id, user_id)
-            return schemas.ProjectResponse.from_orm(project)
+            return schemas.ProjectResponse.model_validate(project)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -131,7 +131,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
             offset=offset,
         )
         return schemas.ProjectListResponse(
-            projects=[schemas.ProjectResponse.from_orm(p) for p in projects],
+            projects=[schemas.ProjectResponse.model_validate(p) for p in projects],
             total=len(projects),
         )
 
@@ -145,7 +145,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 수정."""
         try:
             project = service.update_project(project_id, request, user_id)
-            return schemas.ProjectResponse.from_orm(project)
+            return schemas.ProjectResponse.model_validate(project)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -176,7 +176,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 복제."""
         try:
             project = service.clone_project(project_id, request, user_id)
-            return schemas.ProjectResponse.from_orm(project)
+            return schemas.ProjectResponse.model_validate(project)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -196,7 +196,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """멤버 추가."""
         try:
             member = service.add_member(project_id, request, user_id)
-            return schemas.MemberResponse.from_orm(member)
+            return schemas.MemberResponse.model_validate(member)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -213,7 +213,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """멤버 목록."""
         try:
             members = service.list_members(project_id, user_id)
-            return [schemas.MemberResponse.from_orm(m) for m in members]
+            return [schemas.MemberResponse.model_validate(m) for m in members]
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -233,7 +233,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """멤버 역할 변경."""
         try:
             member = service.update_member_role(project_id, member_user_id, request, user_id)
-            return schemas.MemberResponse.from_orm(member)
+            return schemas.MemberResponse.model_validate(member)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Member not found") from None
         except PermissionError as e:
@@ -273,7 +273,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
             return schemas.LatestInstructionsResponse(
                 instructions={
                     project_id: (
-                        schemas.InstructionResponse.from_orm(instruction)
+                        schemas.InstructionResponse.model_validate(instruction)
                         if instruction
                         else None
                     )
@@ -297,7 +297,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """새 지침 버전 생성."""
         try:
             instruction = service.create_instruction(project_id, request, user_id)
-            return schemas.InstructionResponse.from_orm(instruction)
+            return schemas.InstructionResponse.model_validate(instruction)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -315,7 +315,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """지침 버전 목록."""
         try:
             instructions = service.list_instructions(project_id, user_id)
-            return [schemas.InstructionResponse.from_orm(i) for i in instructions]
+            return [schemas.InstructionResponse.model_validate(i) for i in instructions]
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -334,7 +334,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """특정 버전 지침 조회."""
         try:
             instruction = service.get_instruction(project_id, version, user_id)
-            return schemas.InstructionResponse.from_orm(instruction)
+            return schemas.InstructionResponse.model_validate(instruction)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Instruction not found") from None
         except PermissionError as e:
@@ -354,7 +354,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 업데이트 생성."""
         try:
             update = service.create_update(project_id, request, user_id)
-            return schemas.UpdateResponse.from_orm(update)
+            return schemas.UpdateResponse.model_validate(update)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Project not found") from None
         except PermissionError as e:
@@ -371,7 +371,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 업데이트 목록 조회."""
         try:
             updates = service.list_updates(project_id, user_id)
-            return [schemas.UpdateResponse.from_orm(u) for u in updates]
+            return [schemas.UpdateResponse.model_validate(u) for u in updates]
         except PermissionError as e:
             raise HTTPException(status_code=403, detail=str(e)) from None
 
@@ -385,7 +385,7 @@ def create_app(settings: WorkspaceSettings | None = None) -> FastAPI:
         """프로젝트 업데이트 단건 조회."""
         try:
             update = service.get_update(project_id, update_id, user_id)
-            return schemas.UpdateResponse.from_orm(update)
+            return schemas.UpdateResponse.model_validate(update)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Update not found") from None
         except PermissionError as e:
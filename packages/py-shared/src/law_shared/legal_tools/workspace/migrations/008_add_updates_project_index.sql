@@ -0,0 +1,10 @@
+-- Migration: Index project updates by project
+-- Date: 2026-10-16
+
+BEGIN;
+
+-- list_updates/get_update filter on project_id and order by created_at
+CREATE INDEX IF NOT EXISTS updates_index_1
+    ON updates (project_id, created_at);
+
+COMMIT;
@@ -92,6 +92,7 @@ class Update(Base):
     __tablename__ = "updates"
     __table_args__ = (
         Index("updates_index_0", "created_at"),
+        Index("updates_index_1", "project_id", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
@@ -77,6 +77,7 @@ def init_engine(settings: WorkspaceSettings) -> Engine:
         pool_pre_ping=True,
         pool_size=10,
         max_overflow=20,
+        pool_recycle=1800,
     )
     return engine
 
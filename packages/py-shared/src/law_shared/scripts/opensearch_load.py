@@ -4,8 +4,9 @@ import json
 import logging
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Set
 from urllib.parse import quote
 
 try:  # pragma: no cover - optional dependency for CLI UX
@@ -18,6 +19,11 @@ except ImportError:  # pragma: no cover - fallback when tqdm is unavailable
     def tqdm(iterable, **_kwargs):  # type: ignore
         return iterable
 
+try:  # Optional fast JSON encoder for bulk bodies; stdlib json is the fallback
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 from law_shared.env import load_env
 from law_shared.legal_tools.opensearch_client import (
     request_json,
@@ -185,6 +191,17 @@ def chunked(seq: List[dict], size: int) -> Iterable[List[dict]]:
         yield seq[i : i + size]
 
 
+def _dump_document(doc: dict) -> str:
+    # Document sources (with their full ``meta`` payloads) dominate bulk
+    # request size, so they go through orjson when it is installed.
+    if orjson is not None:
+        try:
+            return orjson.dumps(doc).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys or ints beyond 64 bits
+    return json.dumps(doc, ensure_ascii=False)
+
+
 def build_bulk_payload(documents: List[dict]) -> str:
     lines: list[str] = []
     for doc in documents:
@@ -192,7 +209,7 @@ def build_bulk_payload(documents: List[dict]) -> str:
         if not doc_id:
             raise RuntimeError("Document is missing an 'id' field")
         lines.append(json.dumps({"index": {"_id": doc_id}}, ensure_ascii=False))
-        lines.append(json.dumps(doc, ensure_ascii=False))
+        lines.append(_dump_document(doc))
     return "\n".join(lines) + "\n"
 
 
@@ -211,6 +228,28 @@ def validate_bulk_response(response: dict) -> None:
     raise RuntimeError(detail)
 
 
+def _upload_batch(
+    index_name: str, batch: List[dict], *, max_retries: int, retry_delay: float
+) -> None:
+    logger = logging.getLogger(__name__)
+    payload = build_bulk_payload(batch)
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = request_ndjson("POST", f"/{quote(index_name, safe='')}/_bulk", payload)
+            validate_bulk_response(response)
+            return
+        except RuntimeError as exc:
+            if attempt == max_retries:
+                logger.error(
+                    "Failed to upload batch after %d attempts: %s", max_retries, exc
+                )
+                raise
+            logger.warning(
+                "Error uploading batch (attempt %d/%d): %s", attempt, max_retries, exc
+            )
+            time.sleep(retry_delay)
+
+
 def upload_documents(
     index_name: str,
     documents: List[dict],
@@ -219,39 +258,53 @@ def upload_documents(
     max_retries: int = 3,
     retry_delay: float = 2.0,
     show_progress: bool = True,
+    concurrency: int = 4,
 ) -> None:
+    """Bulk-index *documents*, keeping up to *concurrency* batches in flight.
+
+    Bulk requests are network-bound, so overlapping a few of them hides the
+    round trip; OpenSearch applies each batch independently. Batches are
+    submitted only as earlier ones finish, and the first failure cancels
+    everything not yet started before it is re-raised.
+    """
+
     logger = logging.getLogger(__name__)
     total = (len(documents) + batch_size - 1) // batch_size if documents else 0
-    batches = chunked(documents, batch_size)
-    iterator: Iterable[List[dict]]
-    if show_progress and total:
-        if TQDM_AVAILABLE:
-            iterator = tqdm(
-                batches, total=total, desc="Uploading documents", unit="batch"
-            )
-        else:
-            logger.info("Install the 'tqdm' package to see upload progress bars.")
-            iterator = batches
+    if show_progress and total and not TQDM_AVAILABLE:
+        logger.info("Install the 'tqdm' package to see upload progress bars.")
+    progress = None
+    if show_progress and total and TQDM_AVAILABLE:
+        progress = tqdm(total=total, desc="Uploading documents", unit="batch")
+
+    def _send(batch: List[dict]) -> None:
+        _upload_batch(index_name, batch, max_retries=max_retries, retry_delay=retry_delay)
+
+    def _drain(pending: Set[Future[None]]) -> Set[Future[None]]:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            future.result()
+            if progress is not None:
+                progress.update(1)
+        return pending
+
+    window = max(1, concurrency)
+    pool = ThreadPoolExecutor(max_workers=window)
+    pending: Set[Future[None]] = set()
+    try:
+        for batch in chunked(documents, batch_size):
+            if len(pending) >= window:
+                pending = _drain(pending)
+            pending.add(pool.submit(_send, batch))
+        while pending:
+            pending = _drain(pending)
+    except BaseException:
+        pool.shutdown(wait=True, cancel_futures=True)
+        raise
     else:
-        iterator = batches
-
-    for batch in iterator:
-        payload = build_bulk_payload(batch)
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = request_ndjson("POST", f"/{quote(index_name, safe='')}/_bulk", payload)
-                validate_bulk_response(response)
-                break
-            except RuntimeError as exc:
-                if attempt == max_retries:
-                    logger.error(
-                        "Failed to upload batch after %d attempts: %s", max_retries, exc
-                    )
-                    raise
-                logger.warning(
-                    "Error uploading batch (attempt %d/%d): %s", attempt, max_retries, exc
-                )
-                time.sleep(retry_delay)
+        pool.shutdown(wait=True)
+    finally:
+        if progress is not None:
+            progress.close()
 
 
 def main(*, data_dir: Optional[str] = None, index_name: Optional[str] = None) -> int:
@@ -114,7 +114,9 @@ def upsert_rows(con, rows: list[tuple[str, str, str, str, str]]):
           path  = excluded.path
         """
     )
-    with con.cursor() as cur:
+    # The connection runs in autocommit mode; without an explicit transaction
+    # every row of the batch would be its own commit (and WAL flush).
+    with con.transaction(), con.cursor() as cur:
         cur.executemany(sql, rows)
 
 
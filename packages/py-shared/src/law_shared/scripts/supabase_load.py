@@ -167,7 +167,8 @@ def upsert_rows(con, rows: list[tuple[str, str, str, str, str]]):
           path  = excluded.path
         """
     )
-    with con.cursor() as cur:
+    # One commit per batch instead of one per row under autocommit.
+    with con.transaction(), con.cursor() as cur:
         cur.executemany(sql, rows)
 
 